@@ -7,12 +7,15 @@ from pathlib import Path
 from typing import Iterable, List, Optional
 
 import pandas as pd
+from openpyxl import load_workbook
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.runtime.config import Config, Schema
+from src.runtime.project_paths import iter_workbooks
+from src.tasks.data_processor import excel_header_names
 
 
 RESULT_COLUMNS = [
@@ -89,6 +92,37 @@ def _result_columns_present(df: pd.DataFrame) -> list[str]:
     return [column for column in RESULT_COLUMNS if column in df.columns]
 
 
+def _read_columns(file_path: Path, wanted_headers: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """Read selected header columns (all when ``wanted_headers`` is None) in one read-only pass."""
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        wanted = None if wanted_headers is None else set(wanted_headers)
+        columns: dict = {}
+        selected = []
+        # Blank and repeated headers are named the way read_excel names them.
+        for index, name in enumerate(excel_header_names(header)):
+            if wanted is not None and name not in wanted:
+                continue
+            columns[name] = []
+            selected.append((index, name))
+        row_count = 0
+        last_filled = 0
+        for row in rows:
+            row_count += 1
+            if any(value is not None for value in row):
+                last_filled = row_count
+            for index, name in selected:
+                columns[name].append(row[index] if index < len(row) else None)
+    finally:
+        wb.close()
+    # Match read_excel: trailing empty rows are dropped, interior ones keep their position.
+    return pd.DataFrame({name: values[:last_filled] for name, values in columns.items()})
+
+
 def merge_results(
     task_name: Optional[str] = None,
     strategies: Optional[List[str]] = None,
@@ -112,7 +146,7 @@ def merge_results(
     filters = _normalise_filters(strategies)
     files = sorted(
         file_path
-        for file_path in output_dir.glob("*.xlsx")
+        for file_path in iter_workbooks(output_dir)
         if _matches_strategy(file_path, filters)
     )
     if not files:
@@ -123,27 +157,29 @@ def merge_results(
     print(f"Prediction directory: {output_dir}")
     print(f"Found {len(files)} result files.")
 
-    merged_df = None
+    # Collect per-file frames and concatenate once; concatenating inside the loop
+    # would copy every previously merged column on each iteration.
+    parts: list[pd.DataFrame] = []
     for file_path in files:
         print(f"Loading {file_path.name}...")
-        df = pd.read_excel(file_path, engine="openpyxl")
+        df = _read_columns(file_path, None if not parts else RESULT_COLUMNS)
         prefix = _prefix_for_file(file_path)
         rename_map = {column: f"{prefix} {column}" for column in RESULT_COLUMNS}
 
-        if merged_df is None:
-            merged_df = df.rename(columns=rename_map)
+        if not parts:
+            parts.append(df.rename(columns=rename_map))
             continue
 
         result_cols = _result_columns_present(df)
         if not result_cols:
             print(f"[WARN] No known result columns found in {file_path.name}; skipping.")
             continue
-        subset = df[result_cols].rename(columns=rename_map)
-        merged_df = pd.concat([merged_df, subset], axis=1)
+        parts.append(df[result_cols].rename(columns=rename_map))
 
-    if merged_df is None:
+    if not parts:
         print("Merge failed.")
         return None
+    merged_df = pd.concat(parts, axis=1)
 
     reports_dir.mkdir(parents=True, exist_ok=True)
     timestamp = time.strftime("%Y%m%d_%H%M%S")
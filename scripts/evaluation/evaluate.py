@@ -1,4 +1,5 @@
 import argparse
+import importlib.util
 import re
 import sys
 from pathlib import Path
@@ -14,7 +15,9 @@ from src.evaluation.core import (
     evaluate_merged,
     summarize_bootstrap_ci,
     summarize_boundary_bucket_metrics,
+    normalize_binary_series,
     normalize_binary_value,
+    prepare_truth_frame,
     summarize_mcnemar,
     summarize_decision_source_metrics,
     summarize_dynamic_binary_recommendations,
@@ -42,6 +45,7 @@ from src.prompting.manifest import (
     manifest_path_for_output,
 )
 from src.runtime.config import Config, Schema
+from src.runtime.project_paths import iter_workbooks
 from src.urban.urban_family_gate import load_family_gate_metadata
 from src.urban.urban_training_contract import allowed_training_workbooks, assert_training_source_contract
 
@@ -123,6 +127,9 @@ URBAN_ERROR_CATEGORY_RULES = [
     ),
 ]
 
+# calamine (Rust) parses xlsx several times faster than openpyxl; keep openpyxl as the fallback.
+EXCEL_READ_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else "openpyxl"
+
 STRICT_TRUTH_TRACKS = {"stable_release", "research_matrix"}
 LONG_CONTEXT_ACCURACY_DELTA_THRESHOLD = 1.5
 LONG_CONTEXT_F1_DELTA_THRESHOLD = 0.015
@@ -235,7 +242,7 @@ def resolve_truth_files(
             raise FileNotFoundError(f"Ground-truth file does not exist: {truth_file}")
         return [truth_file]
 
-    truth_files = sorted(labels_dir.glob("*.xlsx"))
+    truth_files = sorted(iter_workbooks(labels_dir))
     if not truth_files:
         raise FileNotFoundError(f"No ground-truth files found: {labels_dir}")
     if experiment_track in STRICT_TRUTH_TRACKS and len(truth_files) != 1:
@@ -290,7 +297,7 @@ def resolve_truth_for_prediction(
 
 def _scope_match(file_name: str, pred_scope: str) -> bool:
     lower_name = file_name.lower()
-    if lower_name.startswith("eval_") or lower_name.startswith("~$"):
+    if lower_name.startswith("eval_"):
         return False
     if pred_scope == "all":
         return True
@@ -321,7 +328,7 @@ def collect_pred_files(
 
     pred_files = sorted(
         file_path
-        for file_path in pred_dir.glob("*.xlsx")
+        for file_path in iter_workbooks(pred_dir)
         if _scope_match(file_path.name, pred_scope)
     )
     if not pred_files:
@@ -339,7 +346,7 @@ def evaluate_one_file(
     chunk_size: int,
     verbose_diagnostics: bool = False,
 ):
-    df_pred = pd.read_excel(pred_file, engine="openpyxl")
+    df_pred = pd.read_excel(pred_file, engine=EXCEL_READ_ENGINE)
     alignment = align_truth_pred(
         truth_df=truth_df,
         pred_df=df_pred,
@@ -519,7 +526,7 @@ def build_prediction_guardrails(
 
     working = pred_df.reset_index(drop=True).copy()
     if Schema.IS_URBAN_RENEWAL in working.columns:
-        predicted = working[Schema.IS_URBAN_RENEWAL].apply(normalize_binary_value)
+        predicted = normalize_binary_series(working[Schema.IS_URBAN_RENEWAL])
     else:
         predicted = pd.Series([-1] * len(working))
 
@@ -1054,7 +1061,7 @@ def _evaluate_prediction_files(args, pred_files, truth_files, report_dir: Path)
                 f"Use --truth or disable --strict-truth-match."
             )
         if truth_file not in truth_cache:
-            truth_cache[truth_file] = pd.read_excel(truth_file, engine="openpyxl")
+            truth_cache[truth_file] = prepare_truth_frame(pd.read_excel(truth_file, engine=EXCEL_READ_ENGINE))
         truth_df = truth_cache[truth_file]
 
         print(f"Evaluating: {pred_file.name}")
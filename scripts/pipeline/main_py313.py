@@ -14,6 +14,7 @@ from src.prompting.manifest import (
 )
 from src.prompting.strategy_registry import PromptStrategyDefinition, PromptStrategyRegistry
 from src.runtime.config import Config
+from src.runtime.project_paths import iter_workbooks
 from src.tasks.task_router import TaskRouter, TaskType, UrbanMethod
 
 
@@ -113,7 +114,7 @@ def select_input_file(experiment_track: str, default_input: str = None):
     dirs = _candidate_input_dirs_for_track(experiment_track)
     files: list[Path] = []
     for directory in dirs:
-        files.extend(sorted(directory.glob("*.xlsx")))
+        files.extend(sorted(iter_workbooks(directory)))
 
     seen = set()
     unique_files: list[Path] = []
@@ -937,14 +938,20 @@ def build_argument_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--non-interactive",
+        "--yes",
         action="store_true",
-        help="Run in batch mode without interactive prompts",
+        help="Run in batch mode without interactive prompts (implied when stdin is not a terminal)",
     )
     return parser
 
 
 def parse_args():
-    return build_argument_parser().parse_args()
+    args = build_argument_parser().parse_args()
+    if not args.non_interactive and not sys.stdin.isatty():
+        # Redirected stdin (CI, pipes, profilers) would block forever on input().
+        print("[INFO] stdin is not a terminal; running with --non-interactive defaults.")
+        args.non_interactive = True
+    return args
 
 
 def prepare_experiment_args(args) -> None:
@@ -413,8 +413,10 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
-    os.environ["LLM_MODEL_NAME"] = STABLE_MODEL_NAME
-    os.environ["DEEPSEEK_MODEL"] = STABLE_MODEL_NAME
+    if not args.dry_run:
+        # Child processes already receive the model pin via stable_child_env().
+        os.environ["LLM_MODEL_NAME"] = STABLE_MODEL_NAME
+        os.environ["DEEPSEEK_MODEL"] = STABLE_MODEL_NAME
     paths = build_paths(dataset_id=args.dataset_id, tag=args.tag)
     python_path = Path(args.python)
     thresholds = StableThresholds()
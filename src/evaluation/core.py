@@ -6,6 +6,13 @@ from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
 from ..runtime.config import Schema
 from ..urban.dynamic_topic_discovery import (
     STATUS_CANDIDATE_NEW_NONURBAN,
@@ -391,14 +398,21 @@ class AlignmentResult:
     summary: Dict[str, float]
 
 
+# RE2 `\s` is ASCII-only; widen it to the same Unicode whitespace set as Python's `\s`.
+_ARROW_WHITESPACE_RUN = r"[\s\v\x1c-\x1f\x85\p{Z}]+"
+
+
 def build_key(series: pd.Series) -> pd.Series:
-    return (
-        series.astype(str)
-        .fillna("")
-        .str.strip()
-        .str.lower()
-        .str.replace(r"\s+", " ", regex=True)
+    text = series.astype(str).fillna("")
+    if pc is None:
+        return text.str.strip().str.lower().str.replace(r"\s+", " ", regex=True)
+    keys = pa.array(text.to_numpy(dtype=object), type=pa.string())
+    keys = pc.replace_substring_regex(
+        pc.utf8_lower(pc.utf8_trim_whitespace(keys)),
+        pattern=_ARROW_WHITESPACE_RUN,
+        replacement=" ",
     )
+    return pd.Series(keys.to_numpy(zero_copy_only=False), index=series.index, dtype=object)
 
 
 def normalize_binary_value(value):
@@ -410,6 +424,13 @@ def normalize_binary_value(value):
     return -1
 
 
+def normalize_binary_series(series: pd.Series) -> pd.Series:
+    """Vectorized ``normalize_binary_value`` that normalizes each distinct value once."""
+    text = series.astype(str)
+    mapping = {value: normalize_binary_value(value) for value in text.unique()}
+    return text.map(mapping).astype(int)
+
+
 def normalize_spatial_level(value):
     text = str(value).strip()
     if text in SPATIAL_LEVEL_MAP:
@@ -553,8 +574,8 @@ def _theme_group(label: str) -> str:
 
 
 def _binary_metrics_from_series(truth: pd.Series, pred: pd.Series) -> Dict[str, float]:
-    truth_norm = truth.apply(normalize_binary_value)
-    pred_norm = pred.apply(normalize_binary_value)
+    truth_norm = normalize_binary_series(truth)
+    pred_norm = normalize_binary_series(pred)
     tp = int(((truth_norm == 1) & (pred_norm == 1)).sum())
     tn = int(((truth_norm == 0) & (pred_norm == 0)).sum())
     fp = int(((truth_norm == 0) & (pred_norm == 1)).sum())
@@ -579,6 +600,18 @@ def _binary_metrics_from_series(truth: pd.Series, pred: pd.Series) -> Dict[str,
     }
 
 
+def prepare_truth_frame(truth_df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize truth columns and build the join key once per truth workbook.
+
+    The returned frame can be passed to ``align_truth_pred`` for every
+    prediction file evaluated against the same truth, skipping re-normalization.
+    """
+    _ensure_required_columns(truth_df, [Schema.TITLE], "真值文件")
+    truth = _normalize_metric_columns(truth_df)
+    truth["_key"] = build_key(truth[Schema.TITLE])
+    return truth
+
+
 def align_truth_pred(
     truth_df: pd.DataFrame,
     pred_df: pd.DataFrame,
@@ -589,10 +622,9 @@ def align_truth_pred(
     _ensure_required_columns(truth_df, required, "真值文件")
     _ensure_required_columns(pred_df, required, "预测文件")
 
-    truth = _normalize_metric_columns(truth_df)
+    truth = truth_df if "_key" in truth_df.columns else prepare_truth_frame(truth_df)
     pred = _normalize_metric_columns(pred_df)
 
-    truth["_key"] = build_key(truth[Schema.TITLE])
     pred["_key"] = build_key(pred[Schema.TITLE])
 
     truth, truth_dup = _deduplicate_on_key(truth, "_key")
@@ -649,12 +681,21 @@ def evaluate_merged(
     if merged_df.empty:
         raise ValueError("无可评估样本: 对齐后结果为空")
 
-    merged = merged_df.copy()
+    # Read-only view: diff flags are collected separately instead of being inserted into the frame.
+    merged = merged_df
     metrics = []
+    diff_columns: Dict[str, np.ndarray] = {}
+    columns = set(merged.columns)
+    resolved_pairs = {
+        field_name: (
+            f"{field_name}_truth" if f"{field_name}_truth" in columns else None,
+            f"{field_name}_pred" if f"{field_name}_pred" in columns else None,
+        )
+        for field_name, _, _ in FIELD_SPECS
+    }
 
     for field_name, metric_name, is_binary in FIELD_SPECS:
-        truth_col = _resolve_truth_col(merged, field_name)
-        pred_col = _resolve_pred_col(merged, field_name)
+        truth_col, pred_col = resolved_pairs[field_name]
         missing_pair = truth_col is None or pred_col is None
 
         if missing_pair:
@@ -662,8 +703,8 @@ def evaluate_merged(
             tp, tn, fp, fn = 0, 0, 0, 0
             precision, recall, f1 = np.nan, np.nan, np.nan
         elif is_binary:
-            truth_norm = merged[truth_col].apply(normalize_binary_value)
-            pred_norm = merged[pred_col].apply(normalize_binary_value)
+            truth_norm = normalize_binary_series(merged[truth_col])
+            pred_norm = normalize_binary_series(merged[pred_col])
             condition = (truth_norm == pred_norm) & (pred_norm.isin([0, 1]))
             tp = ((truth_norm == 1) & (pred_norm == 1)).sum()
             tn = ((truth_norm == 0) & (pred_norm == 0)).sum()
@@ -689,13 +730,13 @@ def evaluate_merged(
 
         diff_col = f"Diff_{metric_name}"
         if missing_pair:
-            merged[diff_col] = np.nan
+            diff_columns[diff_col] = np.full(len(merged), np.nan)
             correct = 0
             total = 0
             accuracy = np.nan
         else:
-            merged[diff_col] = np.where(condition, 1, 0)
-            correct = int(merged[diff_col].sum())
+            diff_columns[diff_col] = np.where(condition, 1, 0).astype(np.int8)
+            correct = int(diff_columns[diff_col].sum())
             total = len(merged)
             accuracy = (correct / total * 100.0) if total else np.nan
 
@@ -722,18 +763,18 @@ def evaluate_merged(
         (Schema.SPATIAL_LEVEL, "Diff_Spatial Level"),
         (Schema.SPATIAL_DESC, "Diff_Spatial Desc"),
     ]
-    detail_output = pd.DataFrame(index=merged.index)
+    detail_columns = {}
     for field_name, diff_col in ordered_metric_pairs:
-        truth_col = _resolve_truth_col(merged, field_name)
-        pred_col = _resolve_pred_col(merged, field_name)
-        detail_output[f"{field_name}_truth"] = merged[truth_col] if truth_col else np.nan
-        detail_output[f"{field_name}_pred"] = merged[pred_col] if pred_col else np.nan
-        detail_output[diff_col] = merged[diff_col] if diff_col in merged.columns else 0
-
-    title_col = f"{Schema.TITLE}_truth" if f"{Schema.TITLE}_truth" in merged.columns else Schema.TITLE
-    abstract_col = f"{Schema.ABSTRACT}_truth" if f"{Schema.ABSTRACT}_truth" in merged.columns else Schema.ABSTRACT
-    detail_output[Schema.TITLE] = merged[title_col] if title_col in merged.columns else ""
-    detail_output[Schema.ABSTRACT] = merged[abstract_col] if abstract_col in merged.columns else ""
+        truth_col, pred_col = resolved_pairs[field_name]
+        detail_columns[f"{field_name}_truth"] = merged[truth_col] if truth_col else np.nan
+        detail_columns[f"{field_name}_pred"] = merged[pred_col] if pred_col else np.nan
+        detail_columns[diff_col] = diff_columns.get(diff_col, 0)
+
+    title_col = f"{Schema.TITLE}_truth" if f"{Schema.TITLE}_truth" in columns else Schema.TITLE
+    abstract_col = f"{Schema.ABSTRACT}_truth" if f"{Schema.ABSTRACT}_truth" in columns else Schema.ABSTRACT
+    detail_columns[Schema.TITLE] = merged[title_col] if title_col in columns else ""
+    detail_columns[Schema.ABSTRACT] = merged[abstract_col] if abstract_col in columns else ""
+    detail_output = pd.DataFrame(detail_columns, index=merged.index)
     detail_output = detail_output[
         [
             Schema.TITLE,
@@ -783,8 +824,8 @@ def summarize_chunked_binary_metrics(
         if truth_col is None or pred_col is None:
             continue
 
-        truth_norm = merged[truth_col].apply(normalize_binary_value)
-        pred_norm = merged[pred_col].apply(normalize_binary_value)
+        truth_norm = normalize_binary_series(merged[truth_col])
+        pred_norm = normalize_binary_series(merged[pred_col])
 
         for chunk_index, start in enumerate(range(0, len(merged), chunk_size), start=1):
             end = min(start + chunk_size, len(merged))
@@ -1061,7 +1102,7 @@ def summarize_decision_source_metrics(
     working["decision_source"] = working["decision_source"].fillna("").replace("", "missing")
     for decision_source, group in working.groupby("decision_source", dropna=False):
         metrics = _binary_metrics_from_series(group[truth_col], group[pred_col])
-        pred_norm = group[pred_col].apply(normalize_binary_value)
+        pred_norm = normalize_binary_series(group[pred_col])
         unknown_rate = 0.0
         if topic_col is not None:
             unknown_rate = float(
@@ -1098,8 +1139,8 @@ def summarize_topic_final_distribution(
 
     working = merged_df.copy()
     working["topic_final_norm"] = working[topic_col].apply(_normalize_theme_label).replace("", UNKNOWN_TOPIC_LABEL)
-    truth_norm = working[truth_col].apply(normalize_binary_value) if truth_col else pd.Series([-1] * len(working))
-    pred_norm = working[pred_col].apply(normalize_binary_value) if pred_col else pd.Series([-1] * len(working))
+    truth_norm = normalize_binary_series(working[truth_col]) if truth_col else pd.Series([-1] * len(working))
+    pred_norm = normalize_binary_series(working[pred_col]) if pred_col else pd.Series([-1] * len(working))
 
     rows = []
     total = len(working)
@@ -1295,7 +1336,7 @@ def summarize_evidence_balance_metrics(
 
     review_flag_col = _resolve_optional_col(working, ["review_flag"], role="pred")
     review_flags = _numeric_flag_series(working, review_flag_col) > 0
-    pred_norm = working[pred_col].apply(normalize_binary_value)
+    pred_norm = normalize_binary_series(working[pred_col])
 
     rows = []
     for balance, group in working.groupby("_evidence_balance_norm", dropna=False):
@@ -1402,8 +1443,8 @@ def summarize_dynamic_topic_distribution(
         role="pred",
     )
 
-    truth_norm = working[truth_col].apply(normalize_binary_value) if truth_col else pd.Series([-1] * len(working), index=working.index)
-    pred_norm = working[pred_col].apply(normalize_binary_value) if pred_col else pd.Series([-1] * len(working), index=working.index)
+    truth_norm = normalize_binary_series(working[truth_col]) if truth_col else pd.Series([-1] * len(working), index=working.index)
+    pred_norm = normalize_binary_series(working[pred_col]) if pred_col else pd.Series([-1] * len(working), index=working.index)
     topic_norm = (
         working[topic_col].apply(_normalize_theme_label).replace("", UNKNOWN_TOPIC_LABEL)
         if topic_col
@@ -1520,7 +1561,7 @@ def summarize_dynamic_binary_recommendations(
     working["_review_priority"] = (
         working[priority_col].fillna("").astype(str).str.strip() if priority_col else ""
     )
-    pred_norm = working[pred_col].apply(normalize_binary_value) if pred_col else pd.Series([-1] * len(working), index=working.index)
+    pred_norm = normalize_binary_series(working[pred_col]) if pred_col else pd.Series([-1] * len(working), index=working.index)
 
     rows = []
     total = len(working)
@@ -1573,8 +1614,8 @@ def summarize_bootstrap_ci(
     if truth_col is None or pred_col is None or merged_df.empty:
         return pd.DataFrame(columns=BOOTSTRAP_CI_OUTPUT_COLUMNS)
 
-    truth = merged_df[truth_col].apply(normalize_binary_value).to_numpy()
-    pred = merged_df[pred_col].apply(normalize_binary_value).to_numpy()
+    truth = normalize_binary_series(merged_df[truth_col]).to_numpy()
+    pred = normalize_binary_series(merged_df[pred_col]).to_numpy()
     if len(truth) == 0:
         return pd.DataFrame(columns=BOOTSTRAP_CI_OUTPUT_COLUMNS)
 
@@ -1644,8 +1685,8 @@ def summarize_mcnemar(
         subset = frame[[key_col, truth_col, pred_col]].copy()
         subset = subset.rename(columns={key_col: "_align_key"})
         subset["correct"] = (
-            subset[truth_col].apply(normalize_binary_value)
-            == subset[pred_col].apply(normalize_binary_value)
+            normalize_binary_series(subset[truth_col])
+            == normalize_binary_series(subset[pred_col])
         ).astype(int)
         metrics = _binary_metrics_from_series(subset[truth_col], subset[pred_col])
         prepared[name] = subset
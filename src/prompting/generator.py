@@ -1,16 +1,40 @@
+import time
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
 
 import yaml
 
 from .strategy_registry import PromptStrategyRegistry
 
+# libyaml's C loader when PyYAML was built with it; same semantics as safe_load.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed template files shared by every PromptGenerator: path -> (mtime_ns, content).
+# An edited template is re-parsed on its next lookup.
+_TEMPLATE_CACHE: Dict[Path, Tuple[int, object]] = {}
+
+
+def _read_template(template_path: Path):
+    mtime_ns = template_path.stat().st_mtime_ns
+    cached = _TEMPLATE_CACHE.get(template_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with template_path.open("r", encoding="utf-8") as handle:
+        content = yaml.load(handle, Loader=_SafeLoader) or {}
+    _TEMPLATE_CACHE[template_path] = (mtime_ns, content)
+    return content
+
 
 class PromptGenerator:
     THEMES = ("urban_renewal", "spatial")
+    # A memoized prompt re-checks its template's mtime at most this often
+    PROMPT_RECHECK_SECONDS = 5.0
 
     def __init__(self, shot_mode: str = "zero", default_theme: str = "urban_renewal"):
         self.template_root = Path(__file__).resolve().parents[1] / "templates"
+        # Finished (stripped, validated) prompts keyed by (theme, strategy, field);
+        # each entry holds (template path, mtime_ns, prompt, last checked) so edits are picked up.
+        self._prompt_cache: Dict[tuple, Tuple[Path, int, str, float]] = {}
         self.registry = self._load_strategy_registry()
         self.THEMES = tuple(self.registry.themes)
         self.default_theme = default_theme
@@ -58,8 +82,7 @@ class PromptGenerator:
                 f"path={template_path}, available={available}"
             )
 
-        with template_path.open("r", encoding="utf-8") as handle:
-            content = yaml.safe_load(handle) or {}
+        content = _read_template(template_path)
         if not isinstance(content, dict):
             raise ValueError(
                 f"Invalid template payload: theme={theme}, strategy={strategy_or_alias}, path={template_path}"
@@ -75,7 +98,36 @@ class PromptGenerator:
             raise ValueError(f"Strategy is not enabled: {strategy}. Available strategies: {', '.join(available)}")
         return definition.name
 
+    def _cached_prompt(self, cache_key: tuple):
+        entry = self._prompt_cache.get(cache_key)
+        if entry is None:
+            return None
+        template_path, mtime_ns, prompt, checked_at = entry
+        now = time.monotonic()
+        if now - checked_at < self.PROMPT_RECHECK_SECONDS:
+            return prompt
+        try:
+            if template_path.stat().st_mtime_ns == mtime_ns:
+                self._prompt_cache[cache_key] = (template_path, mtime_ns, prompt, now)
+                return prompt
+        except OSError:
+            pass
+        return None
+
+    def _remember_prompt(self, cache_key: tuple, prompt: str):
+        theme, strategy, _field = cache_key
+        definition = self.registry.get_definition(theme, strategy)
+        template_path = self.template_root / theme / definition.template_file
+        # Use the mtime the shared template cache parsed, not a fresh stat
+        cached = _TEMPLATE_CACHE.get(template_path)
+        if cached is not None:
+            self._prompt_cache[cache_key] = (template_path, cached[0], prompt, time.monotonic())
+
     def _get_system_prompt(self, theme: str, strategy: str) -> str:
+        cache_key = (theme, strategy, "system_prompt")
+        cached = self._cached_prompt(cache_key)
+        if cached is not None:
+            return cached
         template = self._load_template_payload(theme, strategy)
         system_prompt = str(template.get("system_prompt", "") or "").strip()
         if not system_prompt:
@@ -85,6 +137,7 @@ class PromptGenerator:
             raise ValueError(
                 f"Template content is empty: theme={theme}, strategy={strategy}, path={template_path}"
             )
+        self._remember_prompt(cache_key, system_prompt)
         return system_prompt
 
     def get_system_prompt(self) -> str:
@@ -100,6 +153,10 @@ class PromptGenerator:
         return self._get_system_prompt("urban_renewal", "cot")
 
     def get_reflection_system_prompt(self) -> str:
+        cache_key = ("urban_renewal", "reflection", "system_prompt")
+        cached = self._cached_prompt(cache_key)
+        if cached is not None:
+            return cached
         template = self._load_template_payload(
             "urban_renewal",
             "reflection",
@@ -109,16 +166,23 @@ class PromptGenerator:
         system_prompt = str(template.get("system_prompt", "") or "").strip()
         if not system_prompt:
             raise ValueError("Reflection template is missing system_prompt")
+        self._remember_prompt(cache_key, system_prompt)
         return system_prompt
 
     def get_reflection_critique_prompt(self) -> str:
+        cache_key = ("urban_renewal", "reflection", "reflection_critique")
+        cached = self._cached_prompt(cache_key)
+        if cached is not None:
+            return cached
         template = self._load_template_payload(
             "urban_renewal",
             "reflection",
             allow_disabled=True,
             allow_deprecated=True,
         )
-        return str(template.get("reflection_critique", "") or "").strip()
+        critique = str(template.get("reflection_critique", "") or "").strip()
+        self._remember_prompt(cache_key, critique)
+        return critique
 
     def get_spatial_system_prompt(self) -> str:
         return self._get_system_prompt("spatial", self.shot_mode)
@@ -7,7 +7,7 @@ from typing import Iterable, Optional
 
 from dotenv import load_dotenv
 
-from .project_paths import DEFAULT_STABLE_DATASET_ID, dataset_paths, data_root
+from .project_paths import DEFAULT_STABLE_DATASET_ID, dataset_paths, data_root, ensure_dir
 
 
 def _env_flag(name: str, default: bool = False) -> bool:
@@ -80,116 +80,171 @@ class Config:
     
     # API Settings (Default to DeepSeek if not set)
     # Priority: LLM_ > DEEPSEEK_
-    API_KEY = os.environ.get("LLM_API_KEY") or os.environ.get("DEEPSEEK_API_KEY", "")
-    BASE_URL = os.environ.get("LLM_BASE_URL") or os.environ.get("DEEPSEEK_BASE_URL", "https://api.deepseek.com/v1")
-    MODEL_NAME = os.environ.get("LLM_MODEL_NAME") or os.environ.get("DEEPSEEK_MODEL", "deepseek-v4-flash")
+    API_KEY = ""
+    BASE_URL = "https://api.deepseek.com/v1"
+    MODEL_NAME = "deepseek-v4-flash"
     
     # Experiment Settings
     DEFAULT_SHOT_MODE = "zero"  # zero, one, few
     TEMPERATURE = 1.0
-    MAX_TOKENS = int(os.environ.get("MAX_TOKENS", 500))
-    TIMEOUT = int(os.environ.get("TIMEOUT", 60))
-    MAX_WORKERS = int(os.environ.get("MAX_WORKERS", 1)) # Default 1 for safety
-    PERSIST_FULL_SESSIONS = _env_flag("PERSIST_FULL_SESSIONS", False)
-    AUDIT_FIELD_MAX_CHARS = int(os.environ.get("AUDIT_FIELD_MAX_CHARS", 240))
-    SESSION_MESSAGE_MAX_CHARS = int(os.environ.get("SESSION_MESSAGE_MAX_CHARS", 1200))
-    DEBUG_SENSITIVE_LOGGING = _env_flag("DEBUG_SENSITIVE_LOGGING", False)
-    BERTOPIC_INTEGRITY_KEY = os.environ.get("BERTOPIC_INTEGRITY_KEY", "")
-    BERTOPIC_PRIMARY_ENABLED = _env_flag("BERTOPIC_PRIMARY_ENABLED", True)
-    BERTOPIC_PRIMARY_MIN_SUPPORT = int(os.environ.get("BERTOPIC_PRIMARY_MIN_SUPPORT", 35))
-    BERTOPIC_PRIMARY_MIN_PURITY = float(os.environ.get("BERTOPIC_PRIMARY_MIN_PURITY", 0.80))
-    BERTOPIC_PRIMARY_MIN_PROB = float(os.environ.get("BERTOPIC_PRIMARY_MIN_PROB", 0.50))
-    BERTOPIC_PRIMARY_MIN_MAPPED_SHARE = float(
-        os.environ.get("BERTOPIC_PRIMARY_MIN_MAPPED_SHARE", 0.70)
-    )
-    BERTOPIC_EMBEDDING_MODEL = os.environ.get("BERTOPIC_EMBEDDING_MODEL", "all-MiniLM-L6-v2")
-    URBAN_HYBRID_LLM_ASSIST_ENABLED = _env_flag("URBAN_HYBRID_LLM_ASSIST_ENABLED", True)
-    URBAN_HYBRID_ONLINE_LLM_HINTS_ENABLED = _env_flag("URBAN_HYBRID_ONLINE_LLM_HINTS_ENABLED", True)
-    URBAN_FAMILY_GATE_ENABLED = _env_flag("URBAN_FAMILY_GATE_ENABLED", True)
-    URBAN_FAMILY_GATE_THRESHOLD_URBAN = float(os.environ.get("URBAN_FAMILY_GATE_THRESHOLD_URBAN", 0.72))
-    URBAN_FAMILY_GATE_THRESHOLD_NONURBAN = float(os.environ.get("URBAN_FAMILY_GATE_THRESHOLD_NONURBAN", 0.28))
-    URBAN_ANCHOR_GUARD_ENABLED = _env_flag("URBAN_ANCHOR_GUARD_ENABLED", True)
-    URBAN_ANCHOR_GUARD_FAMILY_PROB_FLOOR = float(
-        os.environ.get("URBAN_ANCHOR_GUARD_FAMILY_PROB_FLOOR", 0.40)
-    )
-    URBAN_ANCHOR_GUARD_BINARY_PROB_FLOOR = float(
-        os.environ.get("URBAN_ANCHOR_GUARD_BINARY_PROB_FLOOR", 0.50)
-    )
-    URBAN_ANCHOR_GUARD_PROMOTE_REQUIRES_URBAN_CANDIDATE = _env_flag(
-        "URBAN_ANCHOR_GUARD_PROMOTE_REQUIRES_URBAN_CANDIDATE",
-        True,
-    )
-    URBAN_ANCHOR_GUARD_URBAN_WITHIN_SCORE_FLOOR = float(
-        os.environ.get("URBAN_ANCHOR_GUARD_URBAN_WITHIN_SCORE_FLOOR", 3.60)
-    )
-    URBAN_ANCHOR_GUARD_URBAN_WITHIN_MARGIN_FLOOR = float(
-        os.environ.get("URBAN_ANCHOR_GUARD_URBAN_WITHIN_MARGIN_FLOOR", 1.00)
-    )
-    URBAN_UNCERTAIN_NONURBAN_GUARD_ENABLED = _env_flag(
-        "URBAN_UNCERTAIN_NONURBAN_GUARD_ENABLED",
-        True,
-    )
-    URBAN_UNCERTAIN_NONURBAN_PROMOTE_WITHIN_SCORE_FLOOR = float(
-        os.environ.get("URBAN_UNCERTAIN_NONURBAN_PROMOTE_WITHIN_SCORE_FLOOR", 3.40)
-    )
-    URBAN_UNCERTAIN_NONURBAN_PROMOTE_WITHIN_MARGIN_FLOOR = float(
-        os.environ.get("URBAN_UNCERTAIN_NONURBAN_PROMOTE_WITHIN_MARGIN_FLOOR", 1.00)
-    )
-    URBAN_UNCERTAIN_NONURBAN_PROMOTE_LOCAL_CONF_FLOOR = float(
-        os.environ.get("URBAN_UNCERTAIN_NONURBAN_PROMOTE_LOCAL_CONF_FLOOR", 0.62)
-    )
-    URBAN_UNCERTAIN_NONURBAN_PROMOTE_LOCAL_MARGIN_FLOOR = float(
-        os.environ.get("URBAN_UNCERTAIN_NONURBAN_PROMOTE_LOCAL_MARGIN_FLOOR", 1.20)
-    )
-    URBAN_UNCERTAIN_NONURBAN_PROMOTE_FAMILY_PROB_FLOOR = float(
-        os.environ.get("URBAN_UNCERTAIN_NONURBAN_PROMOTE_FAMILY_PROB_FLOOR", 0.52)
-    )
-    URBAN_BINARY_DECISION_ENABLED = _env_flag("URBAN_BINARY_DECISION_ENABLED", True)
-    URBAN_BINARY_DECISION_THRESHOLD = float(
-        os.environ.get("URBAN_BINARY_DECISION_THRESHOLD", 0.45)
-    )
-    URBAN_BINARY_LOW_CONFIDENCE_REVIEW_FLOOR = float(
-        os.environ.get("URBAN_BINARY_LOW_CONFIDENCE_REVIEW_FLOOR", 0.60)
-    )
-    URBAN_BINARY_REVIEW_MARGIN = float(
-        os.environ.get("URBAN_BINARY_REVIEW_MARGIN", 0.005)
-    )
-    URBAN_BINARY_AUDIT_RESOLUTION_ENABLED = _env_flag(
-        "URBAN_BINARY_AUDIT_RESOLUTION_ENABLED",
-        True,
-    )
-    URBAN_BINARY_RECALL_CALIBRATION_ENABLED = _env_flag(
-        "URBAN_BINARY_RECALL_CALIBRATION_ENABLED",
-        True,
-    )
-    URBAN_BINARY_RECALL_CONTEXT_SCORE_FLOOR = float(
-        os.environ.get("URBAN_BINARY_RECALL_CONTEXT_SCORE_FLOOR", 0.067)
-    )
-    URBAN_BINARY_RECALL_CONTEXT_POSITIVE_FLOOR = float(
-        os.environ.get("URBAN_BINARY_RECALL_CONTEXT_POSITIVE_FLOOR", 0.46)
-    )
-    URBAN_BINARY_RECALL_FINAL_TOPIC_URBAN_FLOOR = float(
-        os.environ.get("URBAN_BINARY_RECALL_FINAL_TOPIC_URBAN_FLOOR", 0.56)
-    )
-    URBAN_BINARY_RECALL_CORE_ANCHOR_FLOOR = float(
-        os.environ.get("URBAN_BINARY_RECALL_CORE_ANCHOR_FLOOR", 0.58)
-    )
-    URBAN_BINARY_RECALL_BROAD_ANCHOR_FLOOR = float(
-        os.environ.get("URBAN_BINARY_RECALL_BROAD_ANCHOR_FLOOR", 0.52)
-    )
-    URBAN_BINARY_RECALL_URBAN_EVIDENCE_FLOOR = float(
-        os.environ.get("URBAN_BINARY_RECALL_URBAN_EVIDENCE_FLOOR", 0.50)
-    )
-    URBAN_OPEN_SET_ENABLED = _env_flag("URBAN_OPEN_SET_ENABLED", True)
-    URBAN_OPEN_SET_FAMILY_PROB_FLOOR = float(
-        os.environ.get("URBAN_OPEN_SET_FAMILY_PROB_FLOOR", 0.52)
-    )
+    MAX_TOKENS = 500
+    TIMEOUT = 60
+    MAX_WORKERS = 1  # Default 1 for safety
+    LLM_MAX_CONCURRENCY = 0  # In-flight LLM requests across all threads; 0 = no extra cap
+    LLM_RETRY_BASE_SLEEP = 2.0
+    LLM_RETRY_MAX_SLEEP = 60.0
+    # Opt-in: sampling runs at TEMPERATURE 1.0, so replaying cached answers changes results
+    LLM_RESPONSE_CACHE_ENABLED = False
+    LLM_RESPONSE_CACHE_DIR = OUTPUT_DIR / "llm_cache"
+    PERSIST_FULL_SESSIONS = False
+    # Write sessions as compact gzipped JSON (<session>.json.gz) instead of indented JSON
+    SESSION_GZIP = False
+    AUDIT_FIELD_MAX_CHARS = 240
+    SESSION_MESSAGE_MAX_CHARS = 1200
+    DEBUG_SENSITIVE_LOGGING = False
+    BERTOPIC_INTEGRITY_KEY = ""
+    BERTOPIC_PRIMARY_ENABLED = True
+    BERTOPIC_PRIMARY_MIN_SUPPORT = 35
+    BERTOPIC_PRIMARY_MIN_PURITY = 0.80
+    BERTOPIC_PRIMARY_MIN_PROB = 0.50
+    BERTOPIC_PRIMARY_MIN_MAPPED_SHARE = 0.70
+    BERTOPIC_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+    URBAN_HYBRID_LLM_ASSIST_ENABLED = True
+    URBAN_HYBRID_ONLINE_LLM_HINTS_ENABLED = True
+    URBAN_FAMILY_GATE_ENABLED = True
+    URBAN_FAMILY_GATE_THRESHOLD_URBAN = 0.72
+    URBAN_FAMILY_GATE_THRESHOLD_NONURBAN = 0.28
+    URBAN_ANCHOR_GUARD_ENABLED = True
+    URBAN_ANCHOR_GUARD_FAMILY_PROB_FLOOR = 0.40
+    URBAN_ANCHOR_GUARD_BINARY_PROB_FLOOR = 0.50
+    URBAN_ANCHOR_GUARD_PROMOTE_REQUIRES_URBAN_CANDIDATE = True
+    URBAN_ANCHOR_GUARD_URBAN_WITHIN_SCORE_FLOOR = 3.60
+    URBAN_ANCHOR_GUARD_URBAN_WITHIN_MARGIN_FLOOR = 1.00
+    URBAN_UNCERTAIN_NONURBAN_GUARD_ENABLED = True
+    URBAN_UNCERTAIN_NONURBAN_PROMOTE_WITHIN_SCORE_FLOOR = 3.40
+    URBAN_UNCERTAIN_NONURBAN_PROMOTE_WITHIN_MARGIN_FLOOR = 1.00
+    URBAN_UNCERTAIN_NONURBAN_PROMOTE_LOCAL_CONF_FLOOR = 0.62
+    URBAN_UNCERTAIN_NONURBAN_PROMOTE_LOCAL_MARGIN_FLOOR = 1.20
+    URBAN_UNCERTAIN_NONURBAN_PROMOTE_FAMILY_PROB_FLOOR = 0.52
+    URBAN_BINARY_DECISION_ENABLED = True
+    URBAN_BINARY_DECISION_THRESHOLD = 0.45
+    URBAN_BINARY_LOW_CONFIDENCE_REVIEW_FLOOR = 0.60
+    URBAN_BINARY_REVIEW_MARGIN = 0.005
+    URBAN_BINARY_AUDIT_RESOLUTION_ENABLED = True
+    URBAN_BINARY_RECALL_CALIBRATION_ENABLED = True
+    URBAN_BINARY_RECALL_CONTEXT_SCORE_FLOOR = 0.067
+    URBAN_BINARY_RECALL_CONTEXT_POSITIVE_FLOOR = 0.46
+    URBAN_BINARY_RECALL_FINAL_TOPIC_URBAN_FLOOR = 0.56
+    URBAN_BINARY_RECALL_CORE_ANCHOR_FLOOR = 0.58
+    URBAN_BINARY_RECALL_BROAD_ANCHOR_FLOOR = 0.52
+    URBAN_BINARY_RECALL_URBAN_EVIDENCE_FLOOR = 0.50
+    URBAN_OPEN_SET_ENABLED = True
+    URBAN_OPEN_SET_FAMILY_PROB_FLOOR = 0.52
     RECOMMENDED_PYTHON = "3.13"
     
     # Context Limits
     MAX_CONTEXT_TOKENS = 128000
+    # Papers (user/assistant turns) kept when a long-context window rotates; 0 = fresh session
+    STEPWISE_LONG_CARRYOVER_TURNS = 0
+    # False skips the Reflection critique round when round 1 is a well-formed non-urban answer
+    REFLECTION_ALWAYS_CRITIQUE = True
     TOKEN_WARNING_THRESHOLD = 0.9  # Warn when 90% full
 
+    # Settings that environment variables may override: attribute -> type.
+    # Each attribute is read from the variable of the same name unless listed in _ENV_ALIASES.
+    _ENV_SETTINGS = {
+        "API_KEY": str,
+        "BASE_URL": str,
+        "MODEL_NAME": str,
+        "MAX_TOKENS": int,
+        "TIMEOUT": int,
+        "MAX_WORKERS": int,
+        "LLM_MAX_CONCURRENCY": int,
+        "LLM_RETRY_BASE_SLEEP": float,
+        "LLM_RETRY_MAX_SLEEP": float,
+        "LLM_RESPONSE_CACHE_ENABLED": bool,
+        "LLM_RESPONSE_CACHE_DIR": Path,
+        "PERSIST_FULL_SESSIONS": bool,
+        "SESSION_GZIP": bool,
+        "AUDIT_FIELD_MAX_CHARS": int,
+        "SESSION_MESSAGE_MAX_CHARS": int,
+        "DEBUG_SENSITIVE_LOGGING": bool,
+        "BERTOPIC_INTEGRITY_KEY": str,
+        "BERTOPIC_PRIMARY_ENABLED": bool,
+        "BERTOPIC_PRIMARY_MIN_SUPPORT": int,
+        "BERTOPIC_PRIMARY_MIN_PURITY": float,
+        "BERTOPIC_PRIMARY_MIN_PROB": float,
+        "BERTOPIC_PRIMARY_MIN_MAPPED_SHARE": float,
+        "BERTOPIC_EMBEDDING_MODEL": str,
+        "URBAN_HYBRID_LLM_ASSIST_ENABLED": bool,
+        "URBAN_HYBRID_ONLINE_LLM_HINTS_ENABLED": bool,
+        "URBAN_FAMILY_GATE_ENABLED": bool,
+        "URBAN_FAMILY_GATE_THRESHOLD_URBAN": float,
+        "URBAN_FAMILY_GATE_THRESHOLD_NONURBAN": float,
+        "URBAN_ANCHOR_GUARD_ENABLED": bool,
+        "URBAN_ANCHOR_GUARD_FAMILY_PROB_FLOOR": float,
+        "URBAN_ANCHOR_GUARD_BINARY_PROB_FLOOR": float,
+        "URBAN_ANCHOR_GUARD_PROMOTE_REQUIRES_URBAN_CANDIDATE": bool,
+        "URBAN_ANCHOR_GUARD_URBAN_WITHIN_SCORE_FLOOR": float,
+        "URBAN_ANCHOR_GUARD_URBAN_WITHIN_MARGIN_FLOOR": float,
+        "URBAN_UNCERTAIN_NONURBAN_GUARD_ENABLED": bool,
+        "URBAN_UNCERTAIN_NONURBAN_PROMOTE_WITHIN_SCORE_FLOOR": float,
+        "URBAN_UNCERTAIN_NONURBAN_PROMOTE_WITHIN_MARGIN_FLOOR": float,
+        "URBAN_UNCERTAIN_NONURBAN_PROMOTE_LOCAL_CONF_FLOOR": float,
+        "URBAN_UNCERTAIN_NONURBAN_PROMOTE_LOCAL_MARGIN_FLOOR": float,
+        "URBAN_UNCERTAIN_NONURBAN_PROMOTE_FAMILY_PROB_FLOOR": float,
+        "URBAN_BINARY_DECISION_ENABLED": bool,
+        "URBAN_BINARY_DECISION_THRESHOLD": float,
+        "URBAN_BINARY_LOW_CONFIDENCE_REVIEW_FLOOR": float,
+        "URBAN_BINARY_REVIEW_MARGIN": float,
+        "URBAN_BINARY_AUDIT_RESOLUTION_ENABLED": bool,
+        "URBAN_BINARY_RECALL_CALIBRATION_ENABLED": bool,
+        "URBAN_BINARY_RECALL_CONTEXT_SCORE_FLOOR": float,
+        "URBAN_BINARY_RECALL_CONTEXT_POSITIVE_FLOOR": float,
+        "URBAN_BINARY_RECALL_FINAL_TOPIC_URBAN_FLOOR": float,
+        "URBAN_BINARY_RECALL_CORE_ANCHOR_FLOOR": float,
+        "URBAN_BINARY_RECALL_BROAD_ANCHOR_FLOOR": float,
+        "URBAN_BINARY_RECALL_URBAN_EVIDENCE_FLOOR": float,
+        "URBAN_OPEN_SET_ENABLED": bool,
+        "URBAN_OPEN_SET_FAMILY_PROB_FLOOR": float,
+        "STEPWISE_LONG_CARRYOVER_TURNS": int,
+        "REFLECTION_ALWAYS_CRITIQUE": bool,
+    }
+    # Priority: LLM_ > DEEPSEEK_ > current value
+    _ENV_ALIASES = {
+        "API_KEY": ("LLM_API_KEY", "DEEPSEEK_API_KEY"),
+        "BASE_URL": ("LLM_BASE_URL", "DEEPSEEK_BASE_URL"),
+        "MODEL_NAME": ("LLM_MODEL_NAME", "DEEPSEEK_MODEL"),
+    }
+
+    # (env file, mtime_ns) of the last load_env() call; repeated calls are no-ops until it changes
+    _env_stamp = None
+
+    @classmethod
+    def _apply_env(cls) -> None:
+        """Re-read every environment-backed setting, keeping the current value as the fallback."""
+        for attr, cast in cls._ENV_SETTINGS.items():
+            names = cls._ENV_ALIASES.get(attr, (attr,))
+            current = getattr(cls, attr)
+            if cast is bool:
+                setattr(cls, attr, _env_flag(names[-1], current))
+                continue
+            value = next((os.environ[name] for name in names[:-1] if os.environ.get(name)), None)
+            if value is None:
+                value = os.environ.get(names[-1], current)
+            setattr(cls, attr, cast(value))
+
+    @classmethod
+    def get_api_key(cls) -> str:
+        """
+        Return the API key. If none is set yet, pick it up from os.environ (e.g. exported
+        after import); .env files are only read by an explicit load_env() call.
+        """
+        if not cls.API_KEY:
+            names = cls._ENV_ALIASES.get("API_KEY", ("API_KEY",))
+            cls.API_KEY = next((os.environ[name] for name in names if os.environ.get(name)), "")
+        return cls.API_KEY
+
     @classmethod
     def load_env(cls, env_path: Optional[Path] = None):
         """Load environment variables from a .env file using python-dotenv"""
@@ -198,228 +253,23 @@ class Config:
             if not env_path.exists():
                 env_path = cls.PROJECT_ROOT / "scripts" / ".env"
         
-        if env_path.exists():
+        env_exists = env_path.exists()
+        env_stamp = (env_path, env_path.stat().st_mtime_ns if env_exists else None)
+        if cls._env_stamp == env_stamp:
+            return
+        cls._env_stamp = env_stamp
+
+        if env_exists:
             print(f"Loading environment from {env_path}")
             load_dotenv(env_path)
             
-            # Update class attributes after loading env
-            # Priority: LLM_ > DEEPSEEK_ > Default
-            cls.API_KEY = os.environ.get("LLM_API_KEY") or os.environ.get("DEEPSEEK_API_KEY", cls.API_KEY)
-            cls.BASE_URL = os.environ.get("LLM_BASE_URL") or os.environ.get("DEEPSEEK_BASE_URL", cls.BASE_URL)
-            cls.MODEL_NAME = os.environ.get("LLM_MODEL_NAME") or os.environ.get("DEEPSEEK_MODEL", cls.MODEL_NAME)
-            
-            # Update system settings
-            cls.MAX_WORKERS = int(os.environ.get("MAX_WORKERS", cls.MAX_WORKERS))
-            cls.MAX_TOKENS = int(os.environ.get("MAX_TOKENS", cls.MAX_TOKENS))
-            cls.TIMEOUT = int(os.environ.get("TIMEOUT", cls.TIMEOUT))
-            cls.PERSIST_FULL_SESSIONS = _env_flag("PERSIST_FULL_SESSIONS", cls.PERSIST_FULL_SESSIONS)
-            cls.AUDIT_FIELD_MAX_CHARS = int(os.environ.get("AUDIT_FIELD_MAX_CHARS", cls.AUDIT_FIELD_MAX_CHARS))
-            cls.SESSION_MESSAGE_MAX_CHARS = int(
-                os.environ.get("SESSION_MESSAGE_MAX_CHARS", cls.SESSION_MESSAGE_MAX_CHARS)
-            )
-            cls.DEBUG_SENSITIVE_LOGGING = _env_flag(
-                "DEBUG_SENSITIVE_LOGGING",
-                cls.DEBUG_SENSITIVE_LOGGING,
-            )
-            cls.BERTOPIC_INTEGRITY_KEY = os.environ.get(
-                "BERTOPIC_INTEGRITY_KEY",
-                cls.BERTOPIC_INTEGRITY_KEY,
-            )
-            cls.BERTOPIC_PRIMARY_ENABLED = _env_flag(
-                "BERTOPIC_PRIMARY_ENABLED",
-                cls.BERTOPIC_PRIMARY_ENABLED,
-            )
-            cls.BERTOPIC_PRIMARY_MIN_SUPPORT = int(
-                os.environ.get("BERTOPIC_PRIMARY_MIN_SUPPORT", cls.BERTOPIC_PRIMARY_MIN_SUPPORT)
-            )
-            cls.BERTOPIC_PRIMARY_MIN_PURITY = float(
-                os.environ.get("BERTOPIC_PRIMARY_MIN_PURITY", cls.BERTOPIC_PRIMARY_MIN_PURITY)
-            )
-            cls.BERTOPIC_PRIMARY_MIN_PROB = float(
-                os.environ.get("BERTOPIC_PRIMARY_MIN_PROB", cls.BERTOPIC_PRIMARY_MIN_PROB)
-            )
-            cls.BERTOPIC_PRIMARY_MIN_MAPPED_SHARE = float(
-                os.environ.get(
-                    "BERTOPIC_PRIMARY_MIN_MAPPED_SHARE",
-                    cls.BERTOPIC_PRIMARY_MIN_MAPPED_SHARE,
-                )
-            )
-            cls.BERTOPIC_EMBEDDING_MODEL = os.environ.get(
-                "BERTOPIC_EMBEDDING_MODEL",
-                cls.BERTOPIC_EMBEDDING_MODEL,
-            )
-            cls.URBAN_HYBRID_LLM_ASSIST_ENABLED = _env_flag(
-                "URBAN_HYBRID_LLM_ASSIST_ENABLED",
-                cls.URBAN_HYBRID_LLM_ASSIST_ENABLED,
-            )
-            cls.URBAN_HYBRID_ONLINE_LLM_HINTS_ENABLED = _env_flag(
-                "URBAN_HYBRID_ONLINE_LLM_HINTS_ENABLED",
-                cls.URBAN_HYBRID_ONLINE_LLM_HINTS_ENABLED,
-            )
-            cls.URBAN_FAMILY_GATE_ENABLED = _env_flag(
-                "URBAN_FAMILY_GATE_ENABLED",
-                cls.URBAN_FAMILY_GATE_ENABLED,
-            )
-            cls.URBAN_FAMILY_GATE_THRESHOLD_URBAN = float(
-                os.environ.get(
-                    "URBAN_FAMILY_GATE_THRESHOLD_URBAN",
-                    cls.URBAN_FAMILY_GATE_THRESHOLD_URBAN,
-                )
-            )
-            cls.URBAN_FAMILY_GATE_THRESHOLD_NONURBAN = float(
-                os.environ.get(
-                    "URBAN_FAMILY_GATE_THRESHOLD_NONURBAN",
-                    cls.URBAN_FAMILY_GATE_THRESHOLD_NONURBAN,
-                )
-            )
-            cls.URBAN_ANCHOR_GUARD_ENABLED = _env_flag(
-                "URBAN_ANCHOR_GUARD_ENABLED",
-                cls.URBAN_ANCHOR_GUARD_ENABLED,
-            )
-            cls.URBAN_ANCHOR_GUARD_FAMILY_PROB_FLOOR = float(
-                os.environ.get(
-                    "URBAN_ANCHOR_GUARD_FAMILY_PROB_FLOOR",
-                    cls.URBAN_ANCHOR_GUARD_FAMILY_PROB_FLOOR,
-                )
-            )
-            cls.URBAN_ANCHOR_GUARD_BINARY_PROB_FLOOR = float(
-                os.environ.get(
-                    "URBAN_ANCHOR_GUARD_BINARY_PROB_FLOOR",
-                    cls.URBAN_ANCHOR_GUARD_BINARY_PROB_FLOOR,
-                )
-            )
-            cls.URBAN_ANCHOR_GUARD_PROMOTE_REQUIRES_URBAN_CANDIDATE = _env_flag(
-                "URBAN_ANCHOR_GUARD_PROMOTE_REQUIRES_URBAN_CANDIDATE",
-                cls.URBAN_ANCHOR_GUARD_PROMOTE_REQUIRES_URBAN_CANDIDATE,
-            )
-            cls.URBAN_ANCHOR_GUARD_URBAN_WITHIN_SCORE_FLOOR = float(
-                os.environ.get(
-                    "URBAN_ANCHOR_GUARD_URBAN_WITHIN_SCORE_FLOOR",
-                    cls.URBAN_ANCHOR_GUARD_URBAN_WITHIN_SCORE_FLOOR,
-                )
-            )
-            cls.URBAN_ANCHOR_GUARD_URBAN_WITHIN_MARGIN_FLOOR = float(
-                os.environ.get(
-                    "URBAN_ANCHOR_GUARD_URBAN_WITHIN_MARGIN_FLOOR",
-                    cls.URBAN_ANCHOR_GUARD_URBAN_WITHIN_MARGIN_FLOOR,
-                )
-            )
-            cls.URBAN_UNCERTAIN_NONURBAN_GUARD_ENABLED = _env_flag(
-                "URBAN_UNCERTAIN_NONURBAN_GUARD_ENABLED",
-                cls.URBAN_UNCERTAIN_NONURBAN_GUARD_ENABLED,
-            )
-            cls.URBAN_UNCERTAIN_NONURBAN_PROMOTE_WITHIN_SCORE_FLOOR = float(
-                os.environ.get(
-                    "URBAN_UNCERTAIN_NONURBAN_PROMOTE_WITHIN_SCORE_FLOOR",
-                    cls.URBAN_UNCERTAIN_NONURBAN_PROMOTE_WITHIN_SCORE_FLOOR,
-                )
-            )
-            cls.URBAN_UNCERTAIN_NONURBAN_PROMOTE_WITHIN_MARGIN_FLOOR = float(
-                os.environ.get(
-                    "URBAN_UNCERTAIN_NONURBAN_PROMOTE_WITHIN_MARGIN_FLOOR",
-                    cls.URBAN_UNCERTAIN_NONURBAN_PROMOTE_WITHIN_MARGIN_FLOOR,
-                )
-            )
-            cls.URBAN_UNCERTAIN_NONURBAN_PROMOTE_LOCAL_CONF_FLOOR = float(
-                os.environ.get(
-                    "URBAN_UNCERTAIN_NONURBAN_PROMOTE_LOCAL_CONF_FLOOR",
-                    cls.URBAN_UNCERTAIN_NONURBAN_PROMOTE_LOCAL_CONF_FLOOR,
-                )
-            )
-            cls.URBAN_UNCERTAIN_NONURBAN_PROMOTE_LOCAL_MARGIN_FLOOR = float(
-                os.environ.get(
-                    "URBAN_UNCERTAIN_NONURBAN_PROMOTE_LOCAL_MARGIN_FLOOR",
-                    cls.URBAN_UNCERTAIN_NONURBAN_PROMOTE_LOCAL_MARGIN_FLOOR,
-                )
-            )
-            cls.URBAN_UNCERTAIN_NONURBAN_PROMOTE_FAMILY_PROB_FLOOR = float(
-                os.environ.get(
-                    "URBAN_UNCERTAIN_NONURBAN_PROMOTE_FAMILY_PROB_FLOOR",
-                    cls.URBAN_UNCERTAIN_NONURBAN_PROMOTE_FAMILY_PROB_FLOOR,
-                )
-            )
-            cls.URBAN_BINARY_DECISION_ENABLED = _env_flag(
-                "URBAN_BINARY_DECISION_ENABLED",
-                cls.URBAN_BINARY_DECISION_ENABLED,
-            )
-            cls.URBAN_BINARY_DECISION_THRESHOLD = float(
-                os.environ.get(
-                    "URBAN_BINARY_DECISION_THRESHOLD",
-                    cls.URBAN_BINARY_DECISION_THRESHOLD,
-                )
-            )
-            cls.URBAN_BINARY_LOW_CONFIDENCE_REVIEW_FLOOR = float(
-                os.environ.get(
-                    "URBAN_BINARY_LOW_CONFIDENCE_REVIEW_FLOOR",
-                    cls.URBAN_BINARY_LOW_CONFIDENCE_REVIEW_FLOOR,
-                )
-            )
-            cls.URBAN_BINARY_REVIEW_MARGIN = float(
-                os.environ.get(
-                    "URBAN_BINARY_REVIEW_MARGIN",
-                    cls.URBAN_BINARY_REVIEW_MARGIN,
-                )
-            )
-            cls.URBAN_BINARY_AUDIT_RESOLUTION_ENABLED = _env_flag(
-                "URBAN_BINARY_AUDIT_RESOLUTION_ENABLED",
-                cls.URBAN_BINARY_AUDIT_RESOLUTION_ENABLED,
-            )
-            cls.URBAN_BINARY_RECALL_CALIBRATION_ENABLED = _env_flag(
-                "URBAN_BINARY_RECALL_CALIBRATION_ENABLED",
-                cls.URBAN_BINARY_RECALL_CALIBRATION_ENABLED,
-            )
-            cls.URBAN_BINARY_RECALL_CONTEXT_SCORE_FLOOR = float(
-                os.environ.get(
-                    "URBAN_BINARY_RECALL_CONTEXT_SCORE_FLOOR",
-                    cls.URBAN_BINARY_RECALL_CONTEXT_SCORE_FLOOR,
-                )
-            )
-            cls.URBAN_BINARY_RECALL_CONTEXT_POSITIVE_FLOOR = float(
-                os.environ.get(
-                    "URBAN_BINARY_RECALL_CONTEXT_POSITIVE_FLOOR",
-                    cls.URBAN_BINARY_RECALL_CONTEXT_POSITIVE_FLOOR,
-                )
-            )
-            cls.URBAN_BINARY_RECALL_FINAL_TOPIC_URBAN_FLOOR = float(
-                os.environ.get(
-                    "URBAN_BINARY_RECALL_FINAL_TOPIC_URBAN_FLOOR",
-                    cls.URBAN_BINARY_RECALL_FINAL_TOPIC_URBAN_FLOOR,
-                )
-            )
-            cls.URBAN_BINARY_RECALL_CORE_ANCHOR_FLOOR = float(
-                os.environ.get(
-                    "URBAN_BINARY_RECALL_CORE_ANCHOR_FLOOR",
-                    cls.URBAN_BINARY_RECALL_CORE_ANCHOR_FLOOR,
-                )
-            )
-            cls.URBAN_BINARY_RECALL_BROAD_ANCHOR_FLOOR = float(
-                os.environ.get(
-                    "URBAN_BINARY_RECALL_BROAD_ANCHOR_FLOOR",
-                    cls.URBAN_BINARY_RECALL_BROAD_ANCHOR_FLOOR,
-                )
-            )
-            cls.URBAN_BINARY_RECALL_URBAN_EVIDENCE_FLOOR = float(
-                os.environ.get(
-                    "URBAN_BINARY_RECALL_URBAN_EVIDENCE_FLOOR",
-                    cls.URBAN_BINARY_RECALL_URBAN_EVIDENCE_FLOOR,
-                )
-            )
-            cls.URBAN_OPEN_SET_ENABLED = _env_flag(
-                "URBAN_OPEN_SET_ENABLED",
-                cls.URBAN_OPEN_SET_ENABLED,
-            )
-            cls.URBAN_OPEN_SET_FAMILY_PROB_FLOOR = float(
-                os.environ.get(
-                    "URBAN_OPEN_SET_FAMILY_PROB_FLOOR",
-                    cls.URBAN_OPEN_SET_FAMILY_PROB_FLOOR,
-                )
-            )
-            
+            cls._apply_env()
+
         # Ensure directories exist
-        cls.SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
-        cls.TRAIN_DIR.mkdir(parents=True, exist_ok=True)
-        cls.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        cls.MODELS_DIR.mkdir(parents=True, exist_ok=True)
+        ensure_dir(cls.SESSIONS_DIR)
+        ensure_dir(cls.TRAIN_DIR)
+        ensure_dir(cls.OUTPUT_DIR)
+        ensure_dir(cls.MODELS_DIR)
 
     @classmethod
     def default_train_input_file(cls) -> Optional[Path]:
@@ -498,3 +348,6 @@ class Config:
                     "Reinstall pandas in the active environment. "
                     f"{recommended_entry}"
                 )
+
+
+Config._apply_env()
@@ -1,5 +1,7 @@
 import os
+import random
 import re
+import threading
 import time
 from typing import List, Dict, Any, Optional
 
@@ -15,6 +17,44 @@ except ImportError:
         pass
 
 from .config import Config
+from .response_cache import ResponseCache
+
+# One SDK client per endpoint so every DeepSeekClient reuses the same
+# keep-alive connection pool instead of opening its own.
+_SHARED_CLIENTS: Dict[tuple, Any] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def _shared_openai_client(api_key: str, base_url: str):
+    key = (api_key, base_url, Config.TIMEOUT)
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(key)
+        if client is None:
+            # chat_completion owns the retry policy; disable the SDK's hidden retry layer.
+            client = OpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                timeout=Config.TIMEOUT,
+                max_retries=0,
+            )
+            _SHARED_CLIENTS[key] = client
+        return client
+
+
+# Process-wide cap on in-flight requests (Config.LLM_MAX_CONCURRENCY, 0 = unbounded), so
+# worker threads can prepare prompts ahead while the provider sees a bounded request rate.
+_REQUEST_SLOTS: Dict[int, threading.Semaphore] = {}
+
+
+def _request_slots() -> Optional[threading.Semaphore]:
+    limit = Config.LLM_MAX_CONCURRENCY
+    if limit <= 0:
+        return None
+    with _SHARED_CLIENTS_LOCK:
+        slots = _REQUEST_SLOTS.get(limit)
+        if slots is None:
+            slots = _REQUEST_SLOTS[limit] = threading.Semaphore(limit)
+        return slots
 
 class DeepSeekClient:
     """
@@ -22,7 +62,7 @@ class DeepSeekClient:
     Despite the name (legacy), it supports any OpenAI-compatible provider.
     """
     def __init__(self, api_key: str = None, base_url: str = None, model: str = None):
-        self.api_key = api_key or Config.API_KEY
+        self.api_key = api_key or Config.get_api_key()
         self.base_url = base_url or Config.BASE_URL
         self.model = model or Config.MODEL_NAME
         
@@ -31,11 +71,11 @@ class DeepSeekClient:
 
         self.client = None
         if OpenAI is not None:
-            self.client = OpenAI(
-                api_key=self.api_key,
-                base_url=self.base_url,
-                timeout=Config.TIMEOUT
-            )
+            self.client = _shared_openai_client(self.api_key, self.base_url)
+
+        self.response_cache = None
+        if Config.LLM_RESPONSE_CACHE_ENABLED:
+            self.response_cache = ResponseCache(Config.LLM_RESPONSE_CACHE_DIR)
 
     def _mask_secret(self, value: str) -> str:
         if not value:
@@ -71,6 +111,26 @@ class DeepSeekClient:
             return text
         return text[:limit] + "...(truncated)"
 
+    def _retry_after_seconds(self, error: Exception) -> Optional[float]:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        try:
+            raw = headers.get("retry-after")
+        except Exception:
+            return None
+        try:
+            return max(0.0, float(raw)) if raw is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    def _retry_delay(self, attempt: int, error: Exception = None, multiplier: float = 1.0) -> float:
+        """Exponential backoff with jitter, honouring a server-provided Retry-After."""
+        retry_after = self._retry_after_seconds(error) if error is not None else None
+        if retry_after is not None:
+            return min(retry_after, Config.LLM_RETRY_MAX_SLEEP)
+        ceiling = min(Config.LLM_RETRY_BASE_SLEEP * multiplier * (2 ** attempt), Config.LLM_RETRY_MAX_SLEEP)
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
+
     def _extract_error_payload(self, error: APIError) -> str:
         body = getattr(error, "body", None)
         if body:
@@ -131,22 +191,41 @@ class DeepSeekClient:
                 "openai package is not installed. Install the project runtime first "
                 "with `python -m pip install -e .[dev]` in Python 3.13."
             )
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = ResponseCache.make_key(
+                self.base_url, self.model, temperature, Config.MAX_TOKENS, messages
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        slots = _request_slots()
         for attempt in range(max_retries):
             try:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    temperature=temperature,
-                    max_tokens=Config.MAX_TOKENS,
-                    stream=False
-                )
+                # Only the request itself holds a slot; retry back-off sleeps do not.
+                if slots is not None:
+                    slots.acquire()
+                try:
+                    response = self.client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=Config.MAX_TOKENS,
+                        stream=False
+                    )
+                finally:
+                    if slots is not None:
+                        slots.release()
                 
                 content = response.choices[0].message.content
+                if cache_key is not None and content:
+                    self.response_cache.put(cache_key, content)
                 return content
                 
             except RateLimitError as e:
                 print(f"Rate Limit Hit (Attempt {attempt+1}/{max_retries}): {e}")
-                time.sleep(5 * (attempt + 1)) # Aggressive backoff
+                if attempt < max_retries - 1:
+                    time.sleep(self._retry_delay(attempt, e, multiplier=2.0))
                 
             except APIError as e:
                 self._print_api_error_diagnostics(e, attempt, max_retries)
@@ -155,7 +234,7 @@ class DeepSeekClient:
                     f"{self._sanitize_diagnostic_text(e)}"
                 )
                 if attempt < max_retries - 1:
-                    time.sleep(2 * (attempt + 1))
+                    time.sleep(self._retry_delay(attempt, e))
                 else:
                     return None
                     
@@ -165,7 +244,7 @@ class DeepSeekClient:
                     f"{self._sanitize_diagnostic_text(e)}"
                 )
                 if attempt < max_retries - 1:
-                    time.sleep(2 * (attempt + 1))
+                    time.sleep(self._retry_delay(attempt, e))
                 else:
                     return None
                     
@@ -1,13 +1,78 @@
+import gzip
 import json
+import math
 import os
 import re
+import threading
 import time
 import uuid
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .config import Config
 
+# Sessions from parallel strategies share one index file.
+_INDEX_LOCK = threading.Lock()
+
+
+def _orjson_dumps(data: Any, option: int = 0) -> Optional[bytes]:
+    """
+    Serialize with orjson, or return None so the caller uses the stdlib json module.
+    orjson rejects numpy scalars and ints beyond 64 bits that json accepts.
+    """
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(data, option=option)
+    except TypeError:
+        return None
+
+
+def _write_json(path: Path, data: Any, fast: bool = True):
+    payload = _orjson_dumps(data, orjson.OPT_INDENT_2) if fast and orjson is not None else None
+    if payload is not None:
+        path.write_bytes(payload)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _loads(payload: bytes) -> Any:
+    """
+    Parse with orjson, falling back to the stdlib json module for files the json
+    fallback writer produced (NaN/Infinity, which orjson rejects).
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(payload)
+
+
+def _read_json(path: Path) -> Any:
+    return _loads(path.read_bytes())
+
+
+def _write_json_gz(path: Path, data: Any, fast: bool = True):
+    payload = _orjson_dumps(data) if fast else None
+    if payload is None:
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    with gzip.open(path, "wb") as f:
+        f.write(payload)
+
+
+def _read_json_gz(path: Path) -> Any:
+    with gzip.open(path, "rb") as f:
+        payload = f.read()
+    return _loads(payload)
+
+
 class ConversationMemory:
     def __init__(
         self,
@@ -31,6 +96,8 @@ class ConversationMemory:
         self.error_code: Optional[str] = None
         self.audit_metadata: Dict[str, Any] = {}
         self._initial_system_prompt = system_prompt or ""
+        self._dirty = False
+        self._total_chars = 0
         
         if session_path:
             self.session_path = Path(session_path)
@@ -40,7 +107,7 @@ class ConversationMemory:
             self.session_path = None
         
         # Try load if session_id existed (and we are using default path) or if explicit path exists
-        if self._session_file_path.exists():
+        if self._gzip_file_path.exists() or self._session_file_path.exists():
             self.load()
             if not self.messages and system_prompt:
                 self.add_system_message(system_prompt)
@@ -56,6 +123,11 @@ class ConversationMemory:
             return self.session_path
         return Config.SESSIONS_DIR / f"{self.session_id}.json"
 
+    @property
+    def _gzip_file_path(self) -> Path:
+        path = self._session_file_path
+        return path.with_name(path.name + ".gz")
+
     def update_audit_metadata(self, metadata: Optional[Dict[str, Any]] = None, **kwargs):
         payload = dict(metadata or {})
         payload.update(kwargs)
@@ -63,13 +135,16 @@ class ConversationMemory:
             if value is None:
                 continue
             self.audit_metadata[str(key)] = self._sanitize_audit_value(value)
+            self._dirty = True
 
     def set_last_event(self, event: Optional[str]):
         self.last_event = str(event or "").strip()
+        self._dirty = True
 
     def set_error_code(self, error_code: Optional[str]):
         value = str(error_code or "").strip()
         self.error_code = value or None
+        self._dirty = True
 
     def add_system_message(self, content: str):
         self._add_message("system", content)
@@ -82,15 +157,30 @@ class ConversationMemory:
 
     def _add_message(self, role: str, content: str):
         self.messages.append({"role": role, "content": content})
+        self._total_chars += len(content)
+        self._dirty = True
         self.check_token_limit()
         # Removed auto-save on every message to improve I/O performance.
-        # Call save() explicitly when needed.
+        # Call save() or flush() explicitly when needed.
 
     def get_messages(self) -> List[Dict[str, str]]:
         return self.messages
 
+    def recent_messages(self, count: int) -> List[Dict[str, str]]:
+        """Return copies of the last count non-system messages."""
+        if count <= 0:
+            return []
+        turns = [m for m in self.messages if m.get("role") != "system"]
+        return [dict(m) for m in turns[-count:]]
+
+    def extend_messages(self, messages: List[Dict[str, str]]):
+        """Append already-formed messages, e.g. turns carried over from a previous session."""
+        for message in messages:
+            self._add_message(message.get("role", ""), message.get("content", ""))
+
     def clear(self):
         self.messages = []
+        self._total_chars = 0
         self.save()
 
     def save(self):
@@ -105,39 +195,61 @@ class ConversationMemory:
             "audit_metadata": self.audit_metadata,
             "messages": self._serialized_messages(),
         }
-        with open(self._session_file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # orjson writes NaN/Infinity as null; keep json's output for such audit values
+        fast = not any(
+            isinstance(value, float) and not math.isfinite(value) for value in self.audit_metadata.values()
+        )
+        if Config.SESSION_GZIP:
+            target, stale = self._gzip_file_path, self._session_file_path
+            _write_json_gz(target, data, fast=fast)
+        else:
+            target, stale = self._session_file_path, self._gzip_file_path
+            _write_json(target, data, fast=fast)
+        # Keep a single copy per session when the format setting changes between runs
+        if stale.exists():
+            stale.unlink()
+        self._dirty = False
             
         # Update index only if not skipped
         if not self.skip_index:
             self._update_index()
 
+    def flush(self):
+        """Persist the session only if it changed since the last save."""
+        if self._dirty:
+            self.save()
+
     def load(self):
         """Load conversation from JSON file."""
-        if not self._session_file_path.exists():
+        if self._gzip_file_path.exists():
+            data = _read_json_gz(self._gzip_file_path)
+        elif self._session_file_path.exists():
+            data = _read_json(self._session_file_path)
+        else:
             return
-            
-        with open(self._session_file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            self.session_id = data.get("session_id", self.session_id)
-            self.created_at = data.get("created_at", self.created_at)
-            self.messages = data.get("messages", [])
-            self.last_event = str(data.get("last_event", self.last_event) or "")
-            self.error_code = data.get("error_code") or self.error_code
-            loaded_metadata = data.get("audit_metadata") or {}
-            if isinstance(loaded_metadata, dict):
-                self.update_audit_metadata(loaded_metadata)
+        self.session_id = data.get("session_id", self.session_id)
+        self.created_at = data.get("created_at", self.created_at)
+        self.messages = data.get("messages", [])
+        self._total_chars = sum(len(m.get("content", "")) for m in self.messages)
+        self.last_event = str(data.get("last_event", self.last_event) or "")
+        self.error_code = data.get("error_code") or self.error_code
+        loaded_metadata = data.get("audit_metadata") or {}
+        if isinstance(loaded_metadata, dict):
+            self.update_audit_metadata(loaded_metadata)
+        self._dirty = False
 
     def _update_index(self):
         """Update the global index.json file."""
-        index_file = Config.INDEX_FILE
+        with _INDEX_LOCK:
+            self._write_index_entry(Config.INDEX_FILE)
+
+    def _write_index_entry(self, index_file: Path):
         entries = []
         
         if index_file.exists():
             try:
-                with open(index_file, "r", encoding="utf-8") as f:
-                    entries = json.load(f)
-            except:
+                entries = _read_json(index_file)
+            except (OSError, ValueError):
                 entries = []
                 
         # Remove existing entry for this session
@@ -168,8 +280,7 @@ class ConversationMemory:
         # Sort by updated_at desc
         entries.sort(key=lambda x: x["updated_at"], reverse=True)
         
-        with open(index_file, "w", encoding="utf-8") as f:
-            json.dump(entries, f, ensure_ascii=False, indent=2)
+        _write_json(index_file, entries)
 
     def check_token_limit(self):
         """Estimate token usage and warn if approaching limit."""
@@ -178,8 +289,7 @@ class ConversationMemory:
 
         # Rough estimation: 1 token ~= 4 chars (English) or 1 char (Chinese)
         # We use a conservative estimate: len(content)
-        total_chars = sum(len(m.get("content", "")) for m in self.messages)
-        estimated_tokens = total_chars  # Conservative for mixed content
+        estimated_tokens = self._total_chars  # Conservative for mixed content
         
         limit = Config.MAX_CONTEXT_TOKENS
         threshold = limit * Config.TOKEN_WARNING_THRESHOLD
@@ -190,8 +300,7 @@ class ConversationMemory:
 
     def is_context_full(self) -> bool:
         """Check if context is nearly full (for strategy decision making)."""
-        total_chars = sum(len(m.get("content", "")) for m in self.messages)
-        estimated_tokens = total_chars
+        estimated_tokens = self._total_chars
         limit = Config.MAX_CONTEXT_TOKENS
         threshold = limit * Config.TOKEN_WARNING_THRESHOLD
         return estimated_tokens > threshold
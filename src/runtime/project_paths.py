@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator, Set
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -19,6 +21,30 @@ def _existing_child_case_insensitive(parent: Path, name: str) -> Path | None:
     return None
 
 
+_ENSURED_DIRS: Set[Path] = set()
+
+
+def ensure_dir(path: Path) -> Path:
+    """``mkdir -p`` that remembers directories already created by this process."""
+    path = Path(path)
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+    return path
+
+
+def iter_workbooks(directory: Path) -> Iterator[Path]:
+    """Yield ``*.xlsx`` files in ``directory``, skipping Excel lock files (``~$name.xlsx``)."""
+    if not os.path.isdir(directory):
+        return
+    # scandir exposes the entry type from the directory listing, avoiding glob's per-entry stat.
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".xlsx") and not name.startswith("~$") and entry.is_file():
+                yield Path(entry.path)
+
+
 def data_root(project_root: Path = PROJECT_ROOT) -> Path:
     existing = _existing_child_case_insensitive(project_root, DEFAULT_DATA_DIR_NAME)
     if existing:
@@ -109,13 +135,13 @@ def run_paths(
 
 
 def ensure_dataset_layout(paths: DatasetPaths) -> None:
-    paths.input_dir.mkdir(parents=True, exist_ok=True)
-    paths.labels_dir.mkdir(parents=True, exist_ok=True)
-    paths.runs_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(paths.input_dir)
+    ensure_dir(paths.labels_dir)
+    ensure_dir(paths.runs_dir)
 
 
 def ensure_run_layout(paths: RunPaths) -> None:
-    paths.prediction_dir.mkdir(parents=True, exist_ok=True)
-    paths.report_dir.mkdir(parents=True, exist_ok=True)
-    paths.review_dir.mkdir(parents=True, exist_ok=True)
-    paths.log_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(paths.prediction_dir)
+    ensure_dir(paths.report_dir)
+    ensure_dir(paths.review_dir)
+    ensure_dir(paths.log_dir)
@@ -0,0 +1,63 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .project_paths import ensure_dir
+
+
+class ResponseCache:
+    """
+    Content-addressed store of LLM responses on disk.
+    Each entry is one small JSON file named by the sha256 of the request, so parallel
+    strategy threads never contend on a shared file and writes are atomic renames.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def make_key(
+        base_url: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        messages: List[Dict[str, str]],
+    ) -> str:
+        # base_url is part of the key: one model name may be served by several endpoints
+        payload = json.dumps(
+            [base_url, model, temperature, max_tokens, messages],
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as handle:
+                entry: Any = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        content = entry.get("content") if isinstance(entry, dict) else None
+        return content if isinstance(content, str) else None
+
+    def put(self, key: str, content: str):
+        path = self._entry_path(key)
+        ensure_dir(path.parent)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"content": content}, handle, ensure_ascii=False)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
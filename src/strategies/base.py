@@ -6,6 +6,11 @@ from ..prompting.generator import PromptGenerator
 from ..runtime.llm_client import DeepSeekClient
 from ..runtime.memory import ConversationMemory
 
+# Label parsing runs on every LLM response; compile the patterns once.
+_STEP_LABEL_RE = re.compile(r'(Step|Field|Phase)\s*\d+', re.IGNORECASE)
+_BINARY_TOKEN_RE = re.compile(r'(?<!\d)(1|0)(?!\d)')
+_YES_RE = re.compile(r'\b(yes|true)\b', re.IGNORECASE)
+
 class ExtractionStrategy(ABC):
     def __init__(self, client: DeepSeekClient, prompt_gen: PromptGenerator):
         self.client = client
@@ -96,15 +101,15 @@ class ExtractionStrategy(ABC):
             
         # 1. Pre-process to remove common labels that might contain digits
         # e.g. "Step 1: 0", "Field 1: 0" -> ": 0"
-        clean_text = re.sub(r'(Step|Field|Phase)\s*\d+', '', raw_text, flags=re.IGNORECASE)
+        clean_text = _STEP_LABEL_RE.sub('', raw_text)
         
         # 2. Check for explicit 1 or 0
-        match = re.search(r'(?<!\d)(1|0)(?!\d)', clean_text)
+        match = _BINARY_TOKEN_RE.search(clean_text)
         if match:
             return match.group(1)
             
         # 2. If no clear 1/0 found, check for "Yes"/"No" keywords as fallback
-        if re.search(r'\b(yes|true)\b', raw_text, re.IGNORECASE):
+        if _YES_RE.search(raw_text):
             return "1"
         
         # Default to 0 for any other case (including "Unsure", "待确定", etc.)
@@ -26,23 +26,26 @@ class CoTStrategy(ExtractionStrategy):
         
         # Try to find the result line
         # Strategy: Look for the last non-empty line that looks like fields
-        lines = resp.strip().splitlines()
-        final_line = ""
-        
-        # Iterate backwards to find the data line
-        for line in reversed(lines):
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith("<thinking>") or line.startswith("</thinking>"):
-                continue
-            # Basic heuristic: contains tabs or looks like our format
-            if "\t" in line:
-                final_line = line
-                break
+        final_line = self._last_tab_line(resp)
                 
         if not final_line:
             # Fallback: just try parsing the whole text with base parser
             return self.parse_tab_output(resp)
             
         return self.parse_tab_output(final_line)
+
+    def _last_tab_line(self, text: str) -> str:
+        """
+        Return the last stripped line that contains a tab, skipping <thinking> tag lines.
+        Scans backwards from the last tab, so a long reasoning block is never split into lines.
+        """
+        pos = text.rfind("\t")
+        while pos != -1:
+            start = text.rfind("\n", 0, pos) + 1
+            end = text.find("\n", pos)
+            line = text[start:end if end != -1 else len(text)].strip()
+            # Basic heuristic: contains tabs or looks like our format
+            if "\t" in line and not line.startswith(("<thinking>", "</thinking>")):
+                return line
+            pos = text.rfind("\t", 0, start)
+        return ""
@@ -1,6 +1,7 @@
 from typing import Dict, Any, Optional, Union
 from pathlib import Path
 from .base import ExtractionStrategy
+from ..runtime.config import Config
 
 class ReflectionStrategy(ExtractionStrategy):
     def process(self, title: str, abstract: str, session_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
@@ -18,6 +19,13 @@ class ReflectionStrategy(ExtractionStrategy):
         if not resp1:
             return {}
         memory.add_assistant_message(resp1)
+
+        # A well-formed, literal "0" answer leaves nothing for the critique to refine.
+        # parse_single_output maps unclear answers to "0" too, so check the raw field.
+        if not Config.REFLECTION_ALWAYS_CRITIQUE:
+            parsed = self.parse_tab_output(resp1)
+            if parsed and self._first_tab_field(resp1) == "0":
+                return parsed
         
         # Round 2: Critique & Correction
         critique_prompt = self.prompt_gen.get_reflection_critique_prompt()
@@ -32,3 +40,10 @@ class ReflectionStrategy(ExtractionStrategy):
         
         # The final answer should be in resp2
         return self.parse_tab_output(resp2)
+
+    def _first_tab_field(self, text: str) -> str:
+        """Raw first TAB field of the first non-empty line, as parse_tab_output sees it."""
+        for raw in text.splitlines():
+            if raw.strip():
+                return raw.strip().split("\t")[0].strip()
+        return ""
@@ -19,7 +19,11 @@ class StrategyRegistry:
 
     @classmethod
     def get_strategy(cls, name: str) -> Type[ExtractionStrategy]:
-        return cls._strategies.get(name)
+        strategy_cls = cls._strategies.get(name)
+        if strategy_cls is None:
+            available = ", ".join(cls.list_strategies())
+            raise ValueError(f"Invalid strategy: {name}. Available strategies: {available}")
+        return strategy_cls
 
     @classmethod
     def register(cls, name: str, strategy_cls: Type[ExtractionStrategy]):
@@ -132,7 +132,7 @@ class SpatialExtractionStrategy(ExtractionStrategy):
 
         if self.memory.is_context_full():
             print(f"[INFO] Memory full. Resetting context for SpatialExtractionStrategy.")
-            self.memory.save()
+            self.memory.flush()
             self.memory = self._create_memory(system_prompt, audit_metadata=audit_metadata)
 
         return self.memory
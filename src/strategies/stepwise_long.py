@@ -1,22 +1,33 @@
 import re
 from typing import Dict, Any, Optional, Union
 from pathlib import Path
-from .base import ExtractionStrategy
+from .base import _BINARY_TOKEN_RE, _STEP_LABEL_RE, _YES_RE, ExtractionStrategy
 from ..prompting.generator import PromptGenerator
+from ..runtime.config import Config
 from ..runtime.llm_client import DeepSeekClient
 from ..runtime.memory import ConversationMemory
 
+_EXPLICIT_ANSWER_RES = (
+    re.compile(r'(?:最终答案|最终结论|答案|结论)\s*[:：是为]?\s*([01])\b', re.IGNORECASE),
+    re.compile(r'"?(?:是否属于城市更新研究|is_urban_renewal)"?\s*[:=]\s*"?([01])"?', re.IGNORECASE),
+)
+_SINGLE_DIGIT_LINE_RE = re.compile(r'(?m)^\s*([01])\s*$')
+
 class StepwiseLongContextStrategy(ExtractionStrategy):
     def __init__(
         self,
         client: DeepSeekClient,
         prompt_gen: PromptGenerator,
         max_samples_per_window: int = 50,
+        carryover_turns: Optional[int] = None,
     ):
         super().__init__(client, prompt_gen)
         self.memory: Optional[ConversationMemory] = None
         self.max_samples_per_window = max(1, max_samples_per_window)
         self.samples_in_window = 0
+        if carryover_turns is None:
+            carryover_turns = Config.STEPWISE_LONG_CARRYOVER_TURNS
+        self.carryover_turns = max(0, carryover_turns)
 
     def _get_or_create_memory(
         self,
@@ -41,36 +52,49 @@ class StepwiseLongContextStrategy(ExtractionStrategy):
                 "[INFO] Resetting context for StepwiseLongContextStrategy "
                 f"(samples={self.samples_in_window}, max_window={self.max_samples_per_window})."
             )
-            self.memory.save()
+            # The finished window keeps its own session file; the new window may be
+            # seeded with the latest papers instead of a cold restart.
+            carryover = self._fit_carryover(
+                system_prompt, self.memory.recent_messages(2 * self.carryover_turns)
+            )
+            self.memory.flush()
             self.memory = self._create_memory(system_prompt, audit_metadata=audit_metadata)
+            if carryover:
+                self.memory.extend_messages(carryover)
             self.samples_in_window = 0
 
         return self.memory
 
+    @staticmethod
+    def _fit_carryover(system_prompt: str, carryover: list) -> list:
+        """Drop the oldest carried-over turns until the seeded window is below the context threshold."""
+        threshold = Config.MAX_CONTEXT_TOKENS * Config.TOKEN_WARNING_THRESHOLD
+        size = len(system_prompt or "") + sum(len(m.get("content", "")) for m in carryover)
+        while carryover and size > threshold:
+            size -= sum(len(m.get("content", "")) for m in carryover[:2])
+            carryover = carryover[2:]
+        return carryover
+
     def _parse_single_output_with_reason(self, text: str) -> tuple[str, str]:
         raw_text = text.strip()
         if not raw_text:
             return "0", "empty_text"
 
-        explicit_patterns = [
-            r'(?:最终答案|最终结论|答案|结论)\s*[:：是为]?\s*([01])\b',
-            r'"?(?:是否属于城市更新研究|is_urban_renewal)"?\s*[:=]\s*"?([01])"?',
-        ]
-        for pattern in explicit_patterns:
-            match = re.search(pattern, raw_text, re.IGNORECASE)
+        for pattern in _EXPLICIT_ANSWER_RES:
+            match = pattern.search(raw_text)
             if match:
                 return match.group(1), "explicit_answer_pattern"
 
-        clean_text = re.sub(r'(Step|Field|Phase)\s*\d+', '', raw_text, flags=re.IGNORECASE)
-        line_match = re.search(r'(?m)^\s*([01])\s*$', clean_text)
+        clean_text = _STEP_LABEL_RE.sub('', raw_text)
+        line_match = _SINGLE_DIGIT_LINE_RE.search(clean_text)
         if line_match:
             return line_match.group(1), "single_digit_line"
 
-        match = re.search(r'(?<!\d)(1|0)(?!\d)', clean_text)
+        match = _BINARY_TOKEN_RE.search(clean_text)
         if match:
             return match.group(1), "fallback_first_digit"
 
-        if re.search(r'\b(yes|true)\b', raw_text, re.IGNORECASE):
+        if _YES_RE.search(raw_text):
             return "1", "fallback_boolean_yes"
 
         return "0", "no_label_detected"
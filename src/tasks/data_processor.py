@@ -1,18 +1,112 @@
 ﻿import pandas as pd
+import csv
+import os
+import queue
+import threading
 import time
 import shutil
 import re
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 from tqdm import tqdm
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from itertools import islice
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from openpyxl import Workbook, load_workbook
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
 from .merged_output import build_review_ready_merged_frame, load_task_input_frame
 from ..prompting.generator import PromptGenerator
 from ..runtime.config import Config, Schema
 from ..runtime.llm_client import DeepSeekClient
+from ..runtime.project_paths import ensure_dir
 from ..strategies import ExtractionStrategy, StrategyRegistry
 
+_CLEAN_TITLE_RE = re.compile(r'[^\w\s-]')
+
+
+def excel_header_names(header: Iterable, width: int = 0) -> List[str]:
+    """
+    Column names for a sheet's header row as pd.read_excel builds them: blank cells
+    become "Unnamed: n" and repeated names get ".1", ".2", ... suffixes.
+    """
+    names = [
+        value if value is not None else f"Unnamed: {position}"
+        for position, value in enumerate(header)
+    ]
+    names.extend(f"Unnamed: {position}" for position in range(len(names), width))
+    seen: Dict[str, int] = {}
+    for position, name in enumerate(names):
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        if count:
+            names[position] = f"{name}.{count}"
+    return names
+
+
+class _CheckpointWriter:
+    """
+    Background thread that writes checkpoint batches handed over by run_batch.
+    The queue holds at most two batches, so a slow disk throttles the producer
+    instead of buffering unbounded snapshots.
+    """
+
+    def __init__(self, write_batch):
+        self._write_batch = write_batch
+        self._queue: "queue.Queue" = queue.Queue(maxsize=2)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+            if self._error is None:
+                try:
+                    self._write_batch(batch)
+                except BaseException as error:
+                    self._error = error
+
+    def submit(self, batch: List):
+        if self._error is not None:
+            raise self._error
+        if batch:
+            self._queue.put(batch)
+
+    def close(self):
+        """Wait for queued batches and re-raise the first write error, if any."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
 class DataProcessor:
+    # Checkpoint interval starts at 10 papers and doubles up to 500; a checkpoint is
+    # also forced once this many seconds have passed since the previous one.
+    CHECKPOINT_FIRST_INTERVAL = 10
+    CHECKPOINT_MAX_INTERVAL = 500
+    CHECKPOINT_MAX_SECONDS = 60.0
+
+    # Known label columns excluded from output rows
+    LEGACY_EXCLUDE_COLUMNS = frozenset({
+        "Label_UrbanRenewal",
+        "Label_Spatial",
+        "Label_Level",
+        "Label_Desc",
+        Schema.IS_URBAN_RENEWAL,
+        Schema.IS_SPATIAL,
+        Schema.SPATIAL_LEVEL,
+        Schema.SPATIAL_DESC,
+        f"{Schema.IS_URBAN_RENEWAL}(浜哄伐)",
+    })
+
     def __init__(self, 
                  client: DeepSeekClient = None, 
                  prompt_gen: PromptGenerator = None,
@@ -31,12 +125,8 @@ class DataProcessor:
             self.strategy_names = strategies
             
         self.strategies: Dict[str, ExtractionStrategy] = {}
-        available_strategies = StrategyRegistry.list_strategies()
-        
         for name in self.strategy_names:
             strategy_cls = StrategyRegistry.get_strategy(name)
-            if not strategy_cls:
-                raise ValueError(f"闈炴硶绛栫暐: {name}. 鍙€夌瓥鐣? {available_strategies}")
             self.strategies[name] = strategy_cls(self.client, self.prompt_gen)
         self._validate_prompt_routes()
         
@@ -44,6 +134,33 @@ class DataProcessor:
         self.serial_strategies = [name for name in self.strategy_names if name == "stepwise_long"]
         self.parallel_strategies = [name for name in self.strategy_names if name != "stepwise_long"]
 
+        # Worker pool shared by every run_batch call on this processor; see close()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_workers = 0
+
+    def _get_pool(self, max_workers: int) -> ThreadPoolExecutor:
+        if self._pool is None or self._pool_workers != max_workers:
+            self.close()
+            self._pool = ThreadPoolExecutor(max_workers=max_workers)
+            self._pool_workers = max_workers
+        return self._pool
+
+    def close(self, cancel_pending: bool = False):
+        """
+        Shut down the worker pool, waiting for submitted strategy calls. With
+        cancel_pending, queued calls are dropped and only in-flight ones are awaited.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=cancel_pending)
+            self._pool = None
+            self._pool_workers = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def _validate_prompt_routes(self):
         for name in self.strategy_names:
             if name == "cot":
@@ -68,15 +185,18 @@ class DataProcessor:
         run_dir = task_dir / "runs" / "research_matrix" / timestamp
         output_dir = run_dir / "predictions"
         labels_dir = task_dir / "input" / "labels"
-        result_dir = run_dir / "reports"
-
-        for directory in [output_dir, labels_dir, result_dir]:
-            directory.mkdir(parents=True, exist_ok=True)
 
+        # Directories are created on first use: output_dir when its workbooks are
+        # written, labels_dir only when the input still needs archiving.
         label_file_path = labels_dir / input_path.name
-        if not label_file_path.exists():
+        if not os.path.exists(label_file_path):
             print(f"Archiving input file to labels: {label_file_path}")
-            shutil.copy2(input_path, label_file_path)
+            ensure_dir(labels_dir)
+            try:
+                # A hardlink archives large workbooks without copying bytes.
+                os.link(input_path, label_file_path)
+            except OSError:
+                shutil.copy2(input_path, label_file_path)
         else:
             print(f"Labels file already exists at: {label_file_path}")
 
@@ -114,62 +234,164 @@ class DataProcessor:
             col_names.extend([f"extra_{i+1}" for i in range(remaining - len(label_cols))])
         return col_names
 
+    def _calamine_cell(self, value):
+        # Match openpyxl's values: empty cells are None, whole numbers stay int.
+        if value == "":
+            return None
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, date) and not isinstance(value, datetime):
+            return datetime(value.year, value.month, value.day)
+        return value
+
+    def _iter_sheet_rows(self, input_path: Path) -> Iterator[tuple]:
+        """Yield the first sheet's rows as tuples, using calamine when it is installed."""
+        if CalamineWorkbook is not None:
+            wb = CalamineWorkbook.from_path(str(input_path))
+            try:
+                convert = self._calamine_cell
+                for row in wb.get_sheet_by_index(0).iter_rows():
+                    yield tuple(convert(value) for value in row)
+            finally:
+                wb.close()
+            return
+
+        wb = load_workbook(input_path, read_only=True, data_only=True)
+        try:
+            yield from wb.active.iter_rows(values_only=True)
+        finally:
+            wb.close()
+
+    def _load_xlsx_streaming(self, input_path: Path, nrows: int = None) -> pd.DataFrame:
+        """
+        Stream the first sheet in a single pass (calamine, or openpyxl's read-only reader).
+        When nrows is given and the sheet has a header row, parsing stops after that many
+        data rows (blank rows included, as with read_excel). Header-less sheets are always read fully because empty-column detection
+        decides the synthesized column names.
+        """
+        rows_iter = self._iter_sheet_rows(input_path)
+        try:
+            first_row = next(rows_iter, None)
+            if first_row is None:
+                return pd.DataFrame()
+            has_header = "Article Title" in first_row and "Abstract" in first_row
+            rows = [] if has_header else [first_row]
+            # Blank rows stay in place so row positions (and paper ids) match pd.read_excel.
+            rows.extend(islice(rows_iter, nrows) if nrows and has_header else rows_iter)
+        finally:
+            rows_iter.close()
+        # Like read_excel, trailing blank rows are trimmed.
+        while rows and not any(value is not None for value in rows[-1]):
+            rows.pop()
+
+        width = max([len(first_row)] + [len(row) for row in rows])
+        columns = [[] for _ in range(width)]
+        for row in rows:
+            for position in range(width):
+                columns[position].append(row[position] if position < len(row) else None)
+
+        if has_header:
+            names = excel_header_names(first_row, width)
+            return pd.DataFrame(dict(zip(names, columns)), columns=names)
+
+        # Header-less input: drop fully empty columns, then synthesize the legacy layout.
+        columns = [values for values in columns if any(value is not None for value in values)]
+        names = self._legacy_header_names(len(columns))
+        return pd.DataFrame(dict(zip(names, columns)), columns=names)
+
     def _load_legacy_input_frame(self, input_path: Path, limit: int = None) -> pd.DataFrame:
-        df = pd.read_excel(input_path, engine="openpyxl")
-        if "Article Title" not in df.columns or "Abstract" not in df.columns:
-            df = pd.read_excel(input_path, engine="openpyxl", header=None)
-            df = df.dropna(axis=1, how="all")
-            df.columns = self._legacy_header_names(df.shape[1])
+        df = self._load_xlsx_streaming(input_path, nrows=limit)
         return df.head(limit) if limit else df
 
-    def _base_result_row(self, row, exclude_cols: List[str]) -> Dict:
-        base_row = row.to_dict()
-        for col in exclude_cols:
-            if col in base_row:
-                del base_row[col]
-        return base_row
+    def _text_column(self, df: pd.DataFrame, column: str) -> List[str]:
+        if column not in df.columns:
+            return [""] * len(df)
+        return df[column].fillna("").astype(str).tolist()
+
+    def _base_result_rows(self, df: pd.DataFrame) -> List[Dict]:
+        """Drop label columns once for the whole frame and return one dict per row."""
+        excluded = self.LEGACY_EXCLUDE_COLUMNS
+        return df.drop(columns=[col for col in df.columns if col in excluded]).to_dict("records")
 
     def _paper_id(self, index: int, title: str) -> str:
-        clean_title = re.sub(r'[^\w\s-]', '', title).strip().replace(' ', '_')
+        clean_title = _CLEAN_TITLE_RE.sub('', title).strip().replace(' ', '_')
         return f"{index+1:03d}_{clean_title[:50]}"
 
-    def _append_strategy_result(self, results_lists: Dict[str, List], name: str, base_row: Dict, extracted: Dict):
-        res_row = base_row.copy()
-        res_row.update(extracted)
-        results_lists[name].append(res_row)
+    def _append_strategy_result(self, results_lists: Dict[str, List], name: str, row_index: int, extracted: Dict):
+        # Only the extracted fields are kept per strategy; base columns are joined at save time.
+        results_lists[name].append((row_index, extracted))
 
-    def _run_parallel_strategies(
+    def _submit_parallel_strategies(
         self,
         executor: ThreadPoolExecutor,
         task_name: str,
         paper_id: str,
         title: str,
         abstract: str,
-        base_row: Dict,
-        results_lists: Dict[str, List],
-    ):
+    ) -> Dict[str, Future]:
         futures = {}
         for name in self.parallel_strategies:
             strategy_obj = self.strategies[name]
             session_path = self.config.SESSIONS_DIR / task_name / paper_id / f"{name}.json"
-            future = executor.submit(strategy_obj.process, title, abstract, session_path)
-            futures[future] = name
+            futures[name] = executor.submit(strategy_obj.process, title, abstract, session_path)
+        return futures
 
-        for future in as_completed(futures):
-            name = futures[future]
+    def _run_inline_strategies(
+        self,
+        task_name: str,
+        paper_id: str,
+        title: str,
+        abstract: str,
+        row_index: int,
+        results_lists: Dict[str, List],
+    ):
+        """Single-worker fast path: run the parallel group on the calling thread."""
+        for name in self.parallel_strategies:
+            session_path = self.config.SESSIONS_DIR / task_name / paper_id / f"{name}.json"
+            try:
+                extracted = self.strategies[name].process(title, abstract, session_path)
+            except Exception as e:
+                if isinstance(e, (FileNotFoundError, ValueError)):
+                    self._raise_fatal_strategy_error(name, e)
+                extracted = {"Error": str(e)}
+            self._append_strategy_result(results_lists, name, row_index, extracted)
+
+    def _collect_parallel_results(
+        self,
+        pending: Dict[Future, tuple],
+        ready: Dict[int, Dict[str, Dict]],
+        order: deque,
+        results_lists: Dict[str, List],
+        return_when: str = FIRST_COMPLETED,
+    ):
+        """
+        Wait for submitted strategy calls (any one, or all with ALL_COMPLETED), buffer their
+        results, then commit every leading paper whose strategies have all finished so result
+        lists stay in input order while later papers keep the pool busy.
+        """
+        done, _ = wait(pending, return_when=return_when)
+        for future in done:
+            row_index, name = pending.pop(future)
             try:
                 extracted = future.result()
             except Exception as e:
                 if isinstance(e, (FileNotFoundError, ValueError)):
                     self._raise_fatal_strategy_error(name, e)
                 extracted = {"Error": str(e)}
-            self._append_strategy_result(results_lists, name, base_row, extracted)
+            ready.setdefault(row_index, {})[name] = extracted
+
+        parallel_count = len(self.parallel_strategies)
+        while order and len(ready.get(order[0], ())) == parallel_count:
+            row_index = order.popleft()
+            finished = ready.pop(row_index)
+            for name in self.parallel_strategies:
+                self._append_strategy_result(results_lists, name, row_index, finished[name])
 
     def _run_serial_strategies(
         self,
         title: str,
         abstract: str,
-        base_row: Dict,
+        row_index: int,
         results_lists: Dict[str, List],
     ):
         for name in self.serial_strategies:
@@ -180,13 +402,117 @@ class DataProcessor:
                 if isinstance(e, (FileNotFoundError, ValueError)):
                     self._raise_fatal_strategy_error(name, e)
                 extracted = {"Error": str(e)}
-            self._append_strategy_result(results_lists, name, base_row, extracted)
+            self._append_strategy_result(results_lists, name, row_index, extracted)
+
+    @staticmethod
+    def _excel_cell_value(value):
+        if isinstance(value, (list, tuple, dict, set)):
+            return str(value)
+        # None, NaN, NaT and pd.NA all become empty cells in both the xlsx and the CSV.
+        if pd.api.types.is_scalar(value) and pd.isna(value):
+            return None
+        return value
+
+    def _write_legacy_workbook(self, path: Path, columns: List[str], rows: Iterable[Dict]):
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        ws.append(columns)
+        cell_value = self._excel_cell_value
+        for res_row in rows:
+            ws.append([cell_value(res_row.get(column)) for column in columns])
+        wb.save(path)
+
+    def _checkpoint_path(self, output_path: Path) -> Path:
+        return output_path.with_name(f"{output_path.stem}.checkpoint.csv")
+
+    def _extend_result_columns(
+        self,
+        name: str,
+        res_list: List,
+        base_rows: List[Dict],
+        result_columns: Dict[str, Dict[str, None]],
+        start: int,
+    ) -> bool:
+        """Extend the ordered column union from res_list[start:]; return True if it grew."""
+        columns = result_columns.get(name)
+        grew = columns is None
+        if columns is None:
+            columns = result_columns[name] = dict.fromkeys(base_rows[res_list[0][0]])
+        for _, extracted in res_list[start:]:
+            for column in extracted:
+                if column not in columns:
+                    columns[column] = None
+                    grew = True
+        return grew
+
+    def _snapshot_checkpoint(
+        self,
+        output_files: Dict[str, Path],
+        results_lists: Dict[str, List],
+        base_rows: List[Dict],
+        result_columns: Dict[str, Dict[str, None]],
+        saved_counts: Dict[str, int],
+    ) -> List[tuple]:
+        """
+        Collect rows completed since the previous checkpoint as (path, columns, rows, rewrite)
+        jobs. Only list slices are taken here; formatting and file I/O happen in
+        _write_checkpoint_batch, normally on the checkpoint writer thread.
+        """
+        batch = []
+        for name, res_list in results_lists.items():
+            saved = saved_counts.get(name, 0)
+            if len(res_list) <= saved:
+                continue
+            rewrite = self._extend_result_columns(name, res_list, base_rows, result_columns, saved)
+            start = 0 if rewrite else saved
+            batch.append(
+                (self._checkpoint_path(output_files[name]), list(result_columns[name]), res_list[start:], rewrite)
+            )
+            saved_counts[name] = len(res_list)
+        return batch
+
+    def _write_checkpoint_batch(self, batch: List[tuple], base_rows: List[Dict]):
+        """
+        Append each job's rows to the CSV file beside its output workbook. Result rows hold
+        (row_index, extracted) pairs and are joined with the shared base rows while writing.
+        The file is only rewritten when a new column appears.
+        """
+        cell_value = self._excel_cell_value
+        for path, columns, rows, rewrite in batch:
+            with open(path, "w" if rewrite else "a", newline="", encoding="utf-8-sig") as handle:
+                writer = csv.writer(handle)
+                if rewrite:
+                    writer.writerow(columns)
+                for row_index, extracted in rows:
+                    res_row = {**base_rows[row_index], **extracted}
+                    writer.writerow([cell_value(res_row.get(column)) for column in columns])
+
+    def _checkpoint_legacy_results(
+        self,
+        output_files: Dict[str, Path],
+        results_lists: Dict[str, List],
+        base_rows: List[Dict],
+        result_columns: Dict[str, Dict[str, None]],
+        saved_counts: Dict[str, int],
+    ):
+        """Write pending checkpoint rows synchronously."""
+        batch = self._snapshot_checkpoint(output_files, results_lists, base_rows, result_columns, saved_counts)
+        self._write_checkpoint_batch(batch, base_rows)
 
-    def _save_legacy_results(self, output_files: Dict[str, Path], results_lists: Dict[str, List]):
+    def _save_legacy_results(
+        self,
+        output_files: Dict[str, Path],
+        results_lists: Dict[str, List],
+        base_rows: List[Dict],
+        result_columns: Dict[str, Dict[str, None]],
+    ):
+        """Write each strategy's final workbook once, after all checkpoints."""
         for name, res_list in results_lists.items():
-            if res_list:
-                temp_df = pd.DataFrame(res_list)
-                temp_df.to_excel(output_files[name], index=False, engine="openpyxl")
+            if not res_list:
+                continue
+            self._extend_result_columns(name, res_list, base_rows, result_columns, 0)
+            rows = ({**base_rows[row_index], **extracted} for row_index, extracted in res_list)
+            self._write_legacy_workbook(output_files[name], list(result_columns[name]), rows)
 
     def run_batch(self, input_file: str = None, output_file: str = None, limit: int = None):
         """
@@ -199,26 +525,15 @@ class DataProcessor:
         # Prepare output files and result containers for each strategy
         output_files = self._build_legacy_output_files(output_file, output_dir, timestamp)
         results_lists = {name: [] for name in self.strategy_names}
+        result_columns: Dict[str, Dict[str, None]] = {}
+        saved_counts: Dict[str, int] = {}
             
         print(f"Reading from {input_path}")
         df = self._load_legacy_input_frame(input_path, limit)
             
         # Ensure output directory exists
         for f in output_files.values():
-            f.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Define known label columns to exclude from output
-        exclude_cols = [
-            "Label_UrbanRenewal", 
-            "Label_Spatial", 
-            "Label_Level", 
-            "Label_Desc",
-            Schema.IS_URBAN_RENEWAL,
-            Schema.IS_SPATIAL,
-            Schema.SPATIAL_LEVEL,
-            Schema.SPATIAL_DESC,
-            f"{Schema.IS_URBAN_RENEWAL}(浜哄伐)", 
-        ]
+            ensure_dir(f.parent)
         
         print(f"Processing {len(df)} papers with mode='{self.prompt_gen.shot_mode}'...")
         print(f"Parallel Strategies: {self.parallel_strategies}")
@@ -228,49 +543,91 @@ class DataProcessor:
             print(f"Output for {name}: {path}")
             
         # Parallel Execution Logic
-        # Max workers for parallel strategies
-        max_workers = self.config.MAX_WORKERS
+        # Size the pool so every parallel strategy of one paper can run at once.
+        max_workers = max(len(self.parallel_strategies), self.config.MAX_WORKERS, 1)
         
-        # Instantiate executor OUTSIDE the loop to reuse threads
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            for index, row in tqdm(df.iterrows(), total=len(df)):
-                title = str(row.get("Article Title", "") or "")
-                abstract = str(row.get("Abstract", "") or "")
-                
-                if not title and not abstract:
-                    continue
-                    
-                # Clean row: remove label columns before adding new results
-                base_row = self._base_result_row(row, exclude_cols)
+        # The pool persists on the processor so threads are reused across rows and runs.
+        # Papers are pipelined: up to max_workers strategy calls stay in flight across
+        # consecutive papers; completions are buffered and committed in row order.
+        # With a single worker nothing can overlap, so the pool is skipped entirely.
+        executor = self._get_pool(max_workers) if max_workers > 1 else None
+        pending: Dict[Future, tuple] = {}
+        ready: Dict[int, Dict[str, Dict]] = {}
+        order = deque()
+        checkpoint_writer = None
+        try:
+            # Columnar access: label columns are removed once, not per row
+            titles = self._text_column(df, "Article Title")
+            abstracts = self._text_column(df, "Abstract")
+            base_rows = self._base_result_rows(df)
+            # Periodic checkpoints are written off the main thread so submissions keep flowing
+            checkpoint_writer = _CheckpointWriter(lambda batch: self._write_checkpoint_batch(batch, base_rows))
+            # Rows with neither title nor abstract are filtered out up front
+            active_rows = [index for index in range(len(df)) if titles[index] or abstracts[index]]
+            checkpoint_interval = self.CHECKPOINT_FIRST_INTERVAL
+            next_checkpoint = checkpoint_interval
+            last_checkpoint_at = time.monotonic()
+            # Bind loop invariants to locals once instead of re-resolving attributes per paper
+            parallel_count = len(self.parallel_strategies)
+            run_serial = bool(self.serial_strategies)
+            checkpoint_max_interval = self.CHECKPOINT_MAX_INTERVAL
+            checkpoint_max_seconds = self.CHECKPOINT_MAX_SECONDS
+            monotonic = time.monotonic
+            for processed, index in enumerate(tqdm(active_rows, total=len(active_rows)), start=1):
+                title = titles[index]
+                abstract = abstracts[index]
                 paper_id = self._paper_id(index, title)
 
                 # ---------------------------------------------------------
                 # Hybrid Execution Block
                 # ---------------------------------------------------------
                 
-                # 1. Submit Parallel Tasks (ThreadPool)
-                if self.parallel_strategies:
-                    self._run_parallel_strategies(
-                        executor,
-                        task_name,
-                        paper_id,
-                        title,
-                        abstract,
-                        base_row,
-                        results_lists,
-                    )
+                # 1. Submit Parallel Tasks (ThreadPool), draining the oldest papers first
+                if parallel_count and executor is None:
+                    self._run_inline_strategies(task_name, paper_id, title, abstract, index, results_lists)
+                elif parallel_count:
+                    while pending and len(pending) + parallel_count > max_workers:
+                        self._collect_parallel_results(pending, ready, order, results_lists)
+                    futures = self._submit_parallel_strategies(executor, task_name, paper_id, title, abstract)
+                    for name, future in futures.items():
+                        pending[future] = (index, name)
+                    order.append(index)
 
                 # 2. Execute Serial Tasks (Main Thread)
                 # CRITICAL: Do NOT pass session_path (or pass None) to reuse the shared memory object
                 # This ensures Long Context memory is maintained across papers.
-                self._run_serial_strategies(title, abstract, base_row, results_lists)
+                if run_serial:
+                    self._run_serial_strategies(title, abstract, index, results_lists)
                 
                 # ---------------------------------------------------------
                 
-                # Save periodically
-                if (index + 1) % 10 == 0 or (index + 1) == len(df):
-                    self._save_legacy_results(output_files, results_lists)
-                    
+                # Append CSV checkpoints on a growing interval; the workbook is written once at the end
+                if (
+                    processed >= next_checkpoint
+                    or monotonic() - last_checkpoint_at >= checkpoint_max_seconds
+                ):
+                    checkpoint_writer.submit(
+                        self._snapshot_checkpoint(output_files, results_lists, base_rows, result_columns, saved_counts)
+                    )
+                    checkpoint_interval = min(checkpoint_interval * 2, checkpoint_max_interval)
+                    next_checkpoint = processed + checkpoint_interval
+                    last_checkpoint_at = monotonic()
+
+            if pending:
+                self._collect_parallel_results(pending, ready, order, results_lists, ALL_COMPLETED)
+            checkpoint_writer.close()
+            self._checkpoint_legacy_results(output_files, results_lists, base_rows, result_columns, saved_counts)
+            self._save_legacy_results(output_files, results_lists, base_rows, result_columns)
+        except BaseException:
+            # Drop queued strategy calls, wait for in-flight ones and queued checkpoints, then propagate
+            self.close(cancel_pending=True)
+            if checkpoint_writer is not None:
+                try:
+                    checkpoint_writer.close()
+                except Exception as error:
+                    print(f"[WARN] Checkpoint write failed: {error}")
+            raise
+
         print(f"Done. All results saved.")
 
         # Auto-merge for combined workflow (stepwise_long + spatial)
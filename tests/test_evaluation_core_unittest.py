@@ -6,7 +6,11 @@ import pandas as pd
 from src.config import Schema
 from src.evaluation_core import (
     align_truth_pred,
+    build_key,
     evaluate_merged,
+    normalize_binary_series,
+    normalize_binary_value,
+    prepare_truth_frame,
     summarize_bootstrap_ci,
     summarize_boundary_bucket_metrics,
     summarize_decision_source_metrics,
@@ -47,6 +51,42 @@ class EvaluationCoreTests(unittest.TestCase):
         self.assertEqual(len(result.diagnostics["truth_unmatched"]), 1)
         self.assertEqual(len(result.diagnostics["pred_unmatched"]), 1)
 
+    def test_prepared_truth_is_reusable_across_predictions(self):
+        truth_df = pd.DataFrame(
+            {
+                "Article Title": [" A ", "B"],
+                "是否属于城市更新研究(人工)": [1, 0],
+            }
+        )
+        prepared = prepare_truth_frame(truth_df)
+        self.assertIn("_key", prepared.columns)
+        self.assertIn("是否属于城市更新研究", prepared.columns)
+        self.assertNotIn("_key", truth_df.columns)
+
+        for pred_labels in ([1, 0], [0, 0]):
+            pred_df = pd.DataFrame(
+                {
+                    "Article Title": ["a", "b"],
+                    "是否属于城市更新研究": pred_labels,
+                }
+            )
+            reused = align_truth_pred(prepared, pred_df, strict=True)
+            fresh = align_truth_pred(truth_df, pred_df, strict=True)
+            pd.testing.assert_frame_equal(reused.merged, fresh.merged)
+        self.assertEqual(list(prepared["_key"]), ["a", "b"])
+
+    def test_build_key_collapses_unicode_whitespace_and_case(self):
+        titles = pd.Series(["  Urban\u00a0 Renewal\tIN  Cities ", "Street\u3000Reuse", None], index=[3, 4, 5])
+        keys = build_key(titles)
+        self.assertEqual(keys.tolist(), ["urban renewal in cities", "street reuse", "none"])
+        self.assertEqual(keys.index.tolist(), [3, 4, 5])
+
+    def test_normalize_binary_series_matches_scalar_normalizer(self):
+        values = pd.Series([1, "1.0", 0.0, " 0 ", "待确定", None, np.nan, "1", 0])
+        expected = values.apply(normalize_binary_value)
+        pd.testing.assert_series_equal(normalize_binary_series(values), expected, check_dtype=False)
+        self.assertTrue(normalize_binary_series(pd.Series([], dtype=object)).empty)
+
     def test_strict_mode_duplicate_key_fail(self):
         truth_df = pd.DataFrame(
             {
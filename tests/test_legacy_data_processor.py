@@ -0,0 +1,178 @@
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.config import Config, Schema
+from src.data_processor import DataProcessor
+from src.strategies import ExtractionStrategy, StrategyRegistry
+
+
+class _DummyPromptGen:
+    shot_mode = "zero"
+
+    def get_single_system_prompt(self):
+        return "system"
+
+
+class _EchoStrategy(ExtractionStrategy):
+    def process(self, title, abstract, session_path=None):
+        # Later papers finish first so out-of-order completion is exercised.
+        time.sleep(0.002 * (30 - int(title[1:])))
+        return {"Echo": title.upper()}
+
+
+def _build_processor(tmp_path, monkeypatch, strategies):
+    monkeypatch.setattr(Config, "DATA_DIR", tmp_path / "data")
+    monkeypatch.setattr(Config, "SESSIONS_DIR", tmp_path / "sessions")
+    monkeypatch.setattr(Config, "MAX_WORKERS", 4)
+    for name in strategies:
+        monkeypatch.setitem(StrategyRegistry._strategies, name, _EchoStrategy)
+    return DataProcessor(client=object(), prompt_gen=_DummyPromptGen(), strategies=strategies)
+
+
+def test_run_batch_keeps_input_order_when_papers_are_pipelined(tmp_path, monkeypatch):
+    processor = _build_processor(tmp_path, monkeypatch, ["echo_a", "echo_b"])
+    input_file = tmp_path / "papers.xlsx"
+    pd.DataFrame(
+        {"Article Title": [f"t{i}" for i in range(25)], "Abstract": ["a"] * 25}
+    ).to_excel(input_file, index=False)
+
+    with processor:
+        processor.run_batch(str(input_file), str(tmp_path / "out.xlsx"))
+        pool = processor._pool
+        processor.run_batch(str(input_file), str(tmp_path / "out.xlsx"))
+        assert processor._pool is pool
+    assert processor._pool is None
+
+    for name in ["echo_a", "echo_b"]:
+        output = pd.read_excel(tmp_path / f"out_{name}.xlsx")
+        assert output["Echo"].tolist() == [f"T{i}" for i in range(25)]
+        checkpoint = pd.read_csv(tmp_path / f"out_{name}.checkpoint.csv", encoding="utf-8-sig")
+        assert checkpoint["Echo"].tolist() == [f"T{i}" for i in range(25)]
+
+
+def test_load_legacy_input_frame_synthesizes_headers_for_headerless_sheet(tmp_path, monkeypatch):
+    processor = _build_processor(tmp_path, monkeypatch, ["echo_a"])
+    input_file = tmp_path / "headerless.xlsx"
+    pd.DataFrame([["t1", "a1", None, 1], ["t2", "a2", None, 0]]).to_excel(
+        input_file, index=False, header=False
+    )
+
+    frame = processor._load_legacy_input_frame(input_file, limit=1)
+
+    assert list(frame.columns) == ["Article Title", "Abstract", Schema.IS_URBAN_RENEWAL]
+    assert frame["Article Title"].tolist() == ["t1"]
+
+
+def test_run_batch_single_worker_runs_strategies_inline(tmp_path, monkeypatch):
+    processor = _build_processor(tmp_path, monkeypatch, ["echo_a"])
+    monkeypatch.setattr(Config, "MAX_WORKERS", 1)
+
+    def _no_pool(*_args, **_kwargs):
+        raise AssertionError("a thread pool should not be created for a single worker")
+
+    monkeypatch.setattr("src.tasks.data_processor.ThreadPoolExecutor", _no_pool)
+    input_file = tmp_path / "papers.xlsx"
+    pd.DataFrame({"Article Title": ["t1", "", "t3"], "Abstract": ["a", "", "c"]}).to_excel(
+        input_file, index=False
+    )
+
+    processor.run_batch(str(input_file), str(tmp_path / "out.xlsx"))
+
+    output = pd.read_excel(tmp_path / "out.xlsx")
+    assert output["Echo"].tolist() == ["T1", "T3"]
+
+
+def test_load_legacy_input_frame_matches_between_calamine_and_openpyxl(tmp_path, monkeypatch):
+    processor = _build_processor(tmp_path, monkeypatch, ["echo_a"])
+    input_file = tmp_path / "papers.xlsx"
+    pd.DataFrame(
+        {"Article Title": ["t1", None, "t3"], "Abstract": ["a", "b", None], "Year": [2020, 2021, 2022]}
+    ).to_excel(input_file, index=False)
+
+    frame = processor._load_legacy_input_frame(input_file)
+    monkeypatch.setattr("src.tasks.data_processor.CalamineWorkbook", None)
+    fallback = processor._load_legacy_input_frame(input_file)
+
+    pd.testing.assert_frame_equal(frame, fallback)
+    assert frame["Year"].tolist() == [2020, 2021, 2022]
+
+
+def test_load_legacy_input_frame_keeps_blank_rows_like_read_excel(tmp_path, monkeypatch):
+    processor = _build_processor(tmp_path, monkeypatch, ["echo_a"])
+    input_file = tmp_path / "papers.xlsx"
+    pd.DataFrame(
+        {"Article Title": ["t1", None, "t3"], "Abstract": ["a1", None, "a3"], "Year": [2020, None, 2022]}
+    ).to_excel(input_file, index=False)
+
+    for limit in (None, 2):
+        expected = pd.read_excel(input_file, nrows=limit)
+        frame = processor._load_legacy_input_frame(input_file, limit=limit)
+        assert frame["Article Title"].fillna("").tolist() == expected["Article Title"].fillna("").tolist()
+        monkeypatch.setattr("src.tasks.data_processor.CalamineWorkbook", None)
+        fallback = processor._load_legacy_input_frame(input_file, limit=limit)
+        assert fallback["Article Title"].fillna("").tolist() == expected["Article Title"].fillna("").tolist()
+        monkeypatch.undo()
+        processor = _build_processor(tmp_path, monkeypatch, ["echo_a"])
+
+    paper_ids = []
+    original_paper_id = processor._paper_id
+
+    def _recording_paper_id(index, title):
+        paper_ids.append(original_paper_id(index, title))
+        return paper_ids[-1]
+
+    monkeypatch.setattr(processor, "_paper_id", _recording_paper_id)
+    processor.run_batch(str(input_file), str(tmp_path / "out.xlsx"))
+    output = pd.read_excel(tmp_path / "out.xlsx")
+    assert output["Echo"].tolist() == ["T1", "T3"]
+    assert paper_ids == ["001_t1", "003_t3"]
+
+
+def test_checkpoint_rows_write_missing_values_as_empty_cells(tmp_path, monkeypatch):
+    processor = _build_processor(tmp_path, monkeypatch, ["echo_a"])
+    checkpoint = tmp_path / "out.checkpoint.csv"
+    base_rows = [{"Article Title": "t1", "Date": pd.NaT, "Count": pd.NA, "Score": float("nan")}]
+    columns = ["Article Title", "Date", "Count", "Score", "Echo"]
+
+    processor._write_checkpoint_batch([(checkpoint, columns, [(0, {"Echo": None})], True)], base_rows)
+
+    lines = checkpoint.read_text(encoding="utf-8-sig").splitlines()
+    assert lines == [",".join(columns), "t1,,,,"]
+
+
+def test_run_batch_abort_cancels_queued_strategy_calls(tmp_path, monkeypatch):
+    processor = _build_processor(tmp_path, monkeypatch, ["echo_a"])
+    calls = []
+    pool = processor._get_pool(1)
+    pool.submit(time.sleep, 0.1)
+    queued = pool.submit(calls.append, "queued")
+
+    processor.close(cancel_pending=True)
+
+    assert queued.cancelled()
+    assert calls == []
+    assert processor._pool is None
+
+    input_file = tmp_path / "papers.xlsx"
+    pd.DataFrame({"Article Title": ["t1", "t2"], "Abstract": ["a", "b"]}).to_excel(input_file, index=False)
+    close_calls = []
+    monkeypatch.setattr(processor, "close", lambda **kwargs: close_calls.append(kwargs))
+
+    def _interrupt(*_args, **_kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(processor, "_save_legacy_results", _interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        processor.run_batch(str(input_file), str(tmp_path / "out.xlsx"))
+    assert close_calls[-1] == {"cancel_pending": True}
+
+
+def test_unknown_strategy_name_is_rejected():
+    with pytest.raises(ValueError, match="Invalid strategy: missing"):
+        DataProcessor(client=object(), prompt_gen=_DummyPromptGen(), strategies=["missing"])
@@ -59,3 +59,22 @@ def test_merge_results_supports_canonical_run_dir(tmp_path):
     assert merged_path is not None
     assert merged_path.parent == run_dir / "reports"
     assert merged_path.exists()
+
+
+def test_read_columns_names_blank_and_repeated_headers_like_read_excel(tmp_path):
+    from openpyxl import Workbook
+
+    from scripts.data.merge_results import _read_columns
+
+    workbook_path = tmp_path / "prediction.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.append([Schema.TITLE, None, "Note", "Note"])
+    ws.append(["A", "x", "first", "second"])
+    wb.save(workbook_path)
+
+    expected = pd.read_excel(workbook_path, engine="openpyxl")
+    frame = _read_columns(workbook_path)
+
+    assert list(frame.columns) == list(expected.columns) == [Schema.TITLE, "Unnamed: 1", "Note", "Note.1"]
+    assert frame.iloc[0].tolist() == expected.iloc[0].tolist()
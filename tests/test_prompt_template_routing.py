@@ -82,3 +82,64 @@ def test_step_prompt_marks_auxiliary_signals_as_weak_and_supports_title_abstract
     assert "[TITLE_ABSTRACT_ONLY MODE]" in prompt
     assert "[AUXILIARY SIGNALS - WEAK HINTS ONLY]" in prompt
     assert "must NOT override clear evidence from the TITLE and ABSTRACT" in prompt
+
+
+def test_system_prompts_parse_each_template_once(monkeypatch):
+    import src.prompting.generator as generator_module
+
+    calls = []
+    original_load = generator_module.yaml.load
+
+    def counting_load(stream, Loader):
+        name = getattr(stream, "name", "")
+        if not name.endswith("strategy_registry.yaml"):
+            calls.append(name)
+        return original_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(generator_module, "_TEMPLATE_CACHE", {})
+    monkeypatch.setattr(generator_module.yaml, "load", counting_load)
+    prompt_gen = PromptGenerator(shot_mode="few")
+
+    first = prompt_gen.get_single_system_prompt()
+    assert prompt_gen.get_single_system_prompt() == first
+    assert prompt_gen.get_step_system_prompt() == first
+    assert PromptGenerator(shot_mode="few").get_single_system_prompt() == first
+    assert len(calls) == 1
+
+
+def test_system_prompts_are_memoized_after_first_lookup(monkeypatch):
+    prompt_gen = PromptGenerator(shot_mode="zero")
+    first = prompt_gen.get_cot_system_prompt()
+    critique = prompt_gen.get_reflection_critique_prompt()
+
+    def fail_lookup(*_args, **_kwargs):
+        raise AssertionError("registry should not be consulted for a cached prompt")
+
+    monkeypatch.setattr(prompt_gen.registry, "get_definition", fail_lookup)
+    assert prompt_gen.get_cot_system_prompt() is first
+    assert prompt_gen.get_reflection_critique_prompt() is critique
+
+
+def test_long_lived_generator_sees_edited_templates(tmp_path):
+    import os
+    import shutil
+
+    template_root = tmp_path / "templates"
+    shutil.copytree(Path(__file__).resolve().parent.parent / "src" / "templates", template_root)
+    prompt_gen = PromptGenerator(shot_mode="zero")
+    prompt_gen.template_root = template_root
+
+    template_file = template_root / "urban_renewal" / "zero.yaml"
+    first = prompt_gen._load_template_payload("urban_renewal", "zero")
+    assert prompt_gen.get_single_system_prompt() == first["system_prompt"].strip()
+    template_file.write_text('system_prompt: "edited prompt"\n', encoding="utf-8")
+    stat = template_file.stat()
+    os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    edited = prompt_gen._load_template_payload("urban_renewal", "zero")
+    assert edited["system_prompt"] == "edited prompt"
+    assert edited != first
+    # Memoized prompts only re-check the template once the recheck interval has passed
+    assert prompt_gen.get_single_system_prompt() == first["system_prompt"].strip()
+    prompt_gen.PROMPT_RECHECK_SECONDS = 0
+    assert prompt_gen.get_single_system_prompt() == "edited prompt"
@@ -128,6 +128,15 @@ def test_resolve_truth_for_prediction_rejects_heuristics_in_stable_release(tmp_p
         assert "forbids heuristic truth matching" in str(exc)
 
 
+def test_resolve_truth_files_ignores_excel_lock_files(tmp_path):
+    labels_dir = tmp_path / "labels"
+    labels_dir.mkdir()
+    (labels_dir / "truth.xlsx").touch()
+    (labels_dir / "~$truth.xlsx").touch()
+    files = resolve_truth_files(labels_dir, experiment_track="stable_release")
+    assert [file.name for file in files] == ["truth.xlsx"]
+
+
 def test_resolve_truth_files_requires_explicit_truth_when_multiple_labels_exist(tmp_path):
     labels_dir = tmp_path / "labels"
     labels_dir.mkdir()